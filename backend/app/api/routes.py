@@ -4,11 +4,12 @@ API Routes
 REST endpoints for controlling and querying the simulation.
 """
 
-from fastapi import APIRouter, HTTPException
+from fastapi import APIRouter, HTTPException, Response
 from pydantic import BaseModel
 from typing import Optional
 
 from app.shared import get_engine, reset_engine
+from app.api.responses import ORJSONResponse
 from app.models.grid_state import GridState
 
 
@@ -31,16 +32,21 @@ class ControlIndustrialRequest(BaseModel):
 
 
 # Routes
-@router.get("/state", response_model=GridState)
+# /state and /tick return pre-serialized JSON. The schema is documented
+# through `responses` so FastAPI doesn't re-validate the payload.
+@router.get("/state", responses={200: {"model": GridState}})
 async def get_current_state():
     """Get current grid state without advancing the simulation"""
-    return get_engine().get_current_state()
+    # Cached per tick, so repeat pollers cost no serialization
+    return Response(content=get_engine().get_current_state_json(), media_type="application/json")
 
 
-@router.post("/tick", response_model=GridState)
+@router.post("/tick", responses={200: {"model": GridState}})
 async def advance_tick():
     """Manually advance simulation by one tick"""
-    return get_engine().tick()
+    sim = get_engine()
+    sim.tick()
+    return Response(content=sim.get_current_state_json(), media_type="application/json")
 
 
 @router.post("/reset")
@@ -124,7 +130,7 @@ async def trigger_calm():
 async def get_simulation_info():
     """Get simulation configuration info"""
     sim = get_engine()
-    return {
+    return ORJSONResponse(content={
         "wind_capacity_mw": sim.wind.total_capacity_mw,
         "solar_capacity_mw": sim.solar.capacity_mw,
         "battery_capacity_mwh": sim.battery.max_capacity_mwh,
@@ -132,7 +138,7 @@ async def get_simulation_info():
         "tick_duration_minutes": sim.time.tick_duration_minutes,
         "current_day": sim.time.current_day,
         "current_hour": sim.time.current_hour
-    }
+    })
 
 
 # Simulation control endpoints
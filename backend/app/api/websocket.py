@@ -5,35 +5,129 @@ Streams real-time simulation state updates to connected clients.
 """
 
 from fastapi import WebSocket, WebSocketDisconnect
-from typing import List
+from pydantic import TypeAdapter
+from typing import Optional, Set, Tuple
 import asyncio
-import json
+import math
+import traceback
 
 from app.shared import get_engine, reset_engine
+from app.models.grid_state import GridState
+from app.simulation.simulation_engine import SimulationEngine
+
+
+# A client that can't take a frame within this window is treated as dead
+SEND_TIMEOUT_SECONDS = 5.0
+
+# Sends dispatched per gather; the event loop is yielded between batches
+BROADCAST_BATCH_SIZE = 50
 
 
 class ConnectionManager:
     """Manages WebSocket connections"""
     
     def __init__(self):
-        self.active_connections: List[WebSocket] = []
+        self.active_connections: Set[WebSocket] = set()
         
-    async def connect(self, websocket: WebSocket):
-        """Accept new WebSocket connection"""
+    async def accept(self, websocket: WebSocket):
+        """Accept new WebSocket connection, without adding it to broadcasts yet"""
         await websocket.accept()
-        self.active_connections.append(websocket)
+
+    def register(self, websocket: WebSocket):
+        """Include an accepted connection in broadcasts"""
+        self.active_connections.add(websocket)
         
     def disconnect(self, websocket: WebSocket):
-        """Remove WebSocket connection"""
-        self.active_connections.remove(websocket)
+        """Remove WebSocket connection (no-op if a broadcast already pruned it)"""
+        self.active_connections.discard(websocket)
         
-    async def broadcast(self, message: dict):
-        """Send message to all connected clients"""
-        for connection in self.active_connections[:]:  # iterate over copy to allow safe removal
-            try:
-                await connection.send_json(message)
-            except:
-                self.active_connections.remove(connection)
+    async def _safe_send(self, connection: WebSocket, payload: str) -> Tuple[WebSocket, bool]:
+        """Send to one client, reporting failure instead of raising"""
+        try:
+            await asyncio.wait_for(connection.send_text(payload), timeout=SEND_TIMEOUT_SECONDS)
+            return connection, True
+        except Exception:
+            return connection, False
+
+    async def broadcast(self, payload: str):
+        """Send a pre-serialized message to all connected clients concurrently"""
+        connections = list(self.active_connections)
+        results = []
+
+        # Large client counts are sent in batches so HTTP requests
+        # aren't starved by one big burst of send tasks
+        for i in range(0, len(connections), BROADCAST_BATCH_SIZE):
+            batch = connections[i:i + BROADCAST_BATCH_SIZE]
+            results += await asyncio.gather(
+                *(self._safe_send(connection, payload) for connection in batch),
+                return_exceptions=True
+            )
+            if i + BROADCAST_BATCH_SIZE < len(connections):
+                await asyncio.sleep(0)
+
+        # Prune failed clients after the sends, not while iterating
+        dead = [
+            result[0] for result in results
+            if not isinstance(result, BaseException) and not result[1]
+        ]
+        for connection in dead:
+            self.active_connections.discard(connection)
+
+
+# GridState -> JSON bytes, built once instead of on every tick
+_GS_ADAPTER = TypeAdapter(GridState)
+_gs_to_json = _GS_ADAPTER.dump_json
+
+# Source fields that only change when the engine is rebuilt. They are sent
+# once in a static_info message and left out of every state_update.
+STATIC_FIELDS = {
+    "wind": {"source_type", "capacity_mw", "num_turbines", "turbine_capacity_mw"},
+    "solar": {"source_type", "capacity_mw", "array_area_m2", "efficiency"},
+    "battery": {
+        "source_type", "capacity_mw", "max_capacity_mwh",
+        "max_charge_rate_mw", "max_discharge_rate_mw", "round_trip_efficiency"
+    },
+    "gas": {"source_type", "capacity_mw", "fuel_cost_per_mwh", "co2_per_mwh"},
+}
+
+# Message envelopes around the serialized state
+_STATE_UPDATE_PREFIX = b'{"type":"state_update","data":'
+_STATIC_INFO_PREFIX = b'{"type":"static_info","data":'
+_MESSAGE_SUFFIX = b'}'
+
+# Static payload of the engine it was built from
+_static_engine: Optional[SimulationEngine] = None
+_static_payload: str = ""
+
+# Engine whose static_info was last broadcast to every client. Only
+# simulation_loop moves this; a new client's own initial send does not
+_broadcast_engine: Optional[SimulationEngine] = None
+
+
+def _frame(prefix: bytes, raw: bytes) -> str:
+    """Wrap serialized data in a constant message envelope (one copy)"""
+    return b"".join((prefix, raw, _MESSAGE_SUFFIX)).decode()
+
+
+def serialize_state(state: GridState) -> str:
+    """Serialize a state update message once so every client shares it"""
+    raw = _gs_to_json(state, by_alias=True, exclude_none=True, exclude=STATIC_FIELDS)
+    return _frame(_STATE_UPDATE_PREFIX, raw)
+
+
+def static_changed(engine: SimulationEngine) -> bool:
+    """Has the engine been rebuilt since static_info was last broadcast?"""
+    return engine is not _broadcast_engine
+
+
+def serialize_static(engine: SimulationEngine, state: GridState) -> str:
+    """Serialize the static fields, once per engine instance"""
+    global _static_engine, _static_payload
+    if engine is not _static_engine:
+        raw = _gs_to_json(state, by_alias=True, include=STATIC_FIELDS)
+        _static_payload = _frame(_STATIC_INFO_PREFIX, raw)
+        _static_engine = engine
+    return _static_payload
 
 
 # Global connection manager
@@ -41,6 +135,49 @@ manager = ConnectionManager()
 is_paused: bool = False
 speed_multiplier: float = 1.0
 
+# Wall-clock seconds per tick at 1x speed
+TICK_PERIOD_SECONDS = 2.0
+
+
+async def simulation_loop():
+    """
+    Background task that advances the shared engine and broadcasts
+    each new state. Runs once per app, no matter how many clients are
+    connected, and keeps to an absolute schedule so serialization and
+    send time don't add to the period.
+    """
+    global _broadcast_engine
+    loop = asyncio.get_running_loop()
+    next_deadline = loop.time()
+
+    while True:
+        period = TICK_PERIOD_SECONDS / speed_multiplier if speed_multiplier > 0 else TICK_PERIOD_SECONDS
+        next_deadline += period
+
+        # Don't burst through missed ticks after a stall
+        now = loop.time()
+        if next_deadline < now - period:
+            next_deadline = now + period
+
+        await asyncio.sleep(max(0.0, next_deadline - loop.time()))
+
+        # Nobody to stream to - leave the clock where it is
+        if is_paused or not manager.active_connections:
+            continue
+
+        # Every client depends on this one task, so a failed tick is
+        # logged and the loop carries on with the next one
+        try:
+            engine = get_engine()
+            state = engine.tick()
+            if static_changed(engine):
+                await manager.broadcast(serialize_static(engine, state))
+                _broadcast_engine = engine
+            await manager.broadcast(serialize_state(state))
+        except Exception as e:
+            print(f"💥 Simulation loop error: {e}")
+            traceback.print_exc()
+
 
 async def websocket_endpoint(websocket: WebSocket):
     """
@@ -48,45 +185,66 @@ async def websocket_endpoint(websocket: WebSocket):
     Uses the shared engine from app.shared so REST control commands
     affect the same simulation instance.
     """
+    global _broadcast_engine
     print("🔌 WebSocket connection attempt...")
-    await manager.connect(websocket)
+    await manager.accept(websocket)
     print("✅ WebSocket accepted!")
 
     try:
-        # Send current state immediately without advancing the clock
-        state = get_engine().get_current_state()
-        await websocket.send_json({
-            "type": "state_update",
-            "data": json.loads(state.model_dump_json())
-        })
-        print("✅ Initial state sent!")
+        # Send current state immediately without advancing the clock.
+        # The client only joins broadcasts afterwards, so a loop tick
+        # during these sends can't put a state_update ahead of static_info
+        engine = get_engine()
+        state = engine.get_current_state()
+        await websocket.send_text(serialize_static(engine, state))
+        await websocket.send_text(serialize_state(state))
+        first_client = not manager.active_connections
+        manager.register(websocket)
 
-        # Simulation loop - send updates based on speed
-        while True:
-            delay = 2.0 / speed_multiplier if speed_multiplier > 0 else 2.0
-            await asyncio.sleep(delay)
+        # Engine reset while those frames were in flight
+        current = get_engine()
+        if current is not engine:
+            await websocket.send_text(serialize_static(current, current.get_current_state()))
 
-            if is_paused:
-                continue
+        # With no other clients, nobody holds an older static_info
+        if first_client:
+            _broadcast_engine = current
+        print("✅ Initial state sent!")
 
-            state = get_engine().tick()
-            message = {
-                "type": "state_update",
-                "data": json.loads(state.model_dump_json())
-            }
-            await manager.broadcast(message)
+        # Updates are pushed by simulation_loop; the socket only
+        # reads control commands from the client
+        while True:
+            try:
+                command = await websocket.receive_json()
+            except (ValueError, KeyError):
+                continue  # ignore malformed JSON and binary frames
+            if isinstance(command, dict):
+                await handle_control_command(websocket, command)
 
     except WebSocketDisconnect:
         print("❌ WebSocket disconnected")
         manager.disconnect(websocket)
     except Exception as e:
         print(f"💥 WebSocket error: {e}")
-        import traceback
         traceback.print_exc()
         manager.disconnect(websocket)
 
 
 # Control commands handler
+def _is_number(value) -> bool:
+    """Is value a finite JSON number? (bool is an int subclass, but not a number here)"""
+    return isinstance(value, (int, float)) and not isinstance(value, bool) and math.isfinite(value)
+
+
+# Actions that take a value, with the check that value must pass
+_VALUE_CHECKS = {
+    "set_wind": _is_number,
+    "set_clouds": _is_number,
+    "set_temperature": _is_number,
+    "toggle_industrial": lambda value: isinstance(value, bool),
+}
+
+
 async def handle_control_command(websocket: WebSocket, command: dict):
     """
     Handle control commands from client
@@ -94,11 +252,25 @@ async def handle_control_command(websocket: WebSocket, command: dict):
     Commands:
     - {"action": "set_wind", "value": 12.5}
     - {"action": "set_clouds", "value": 0.7}
+    - {"action": "toggle_industrial", "value": true}
     - {"action": "reset"}
     - etc.
+
+    A value of the wrong type is answered with an error message and
+    leaves the engine untouched.
     """
     action = command.get("action")
     value = command.get("value")
+
+    check = _VALUE_CHECKS.get(action)
+    if check is not None and not check(value):
+        await websocket.send_json({
+            "type": "error",
+            "action": action,
+            "message": f"invalid value for {action}: {value!r}"
+        })
+        return
+
     engine = get_engine()
 
     if action == "set_wind":
@@ -121,4 +293,4 @@ async def handle_control_command(websocket: WebSocket, command: dict):
         "type": "command_ack",
         "action": action,
         "status": "ok"
-    })
\ No newline at end of file
+    })
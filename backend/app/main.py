@@ -3,16 +3,46 @@ Renewable Grid Simulator - Backend API
 Main FastAPI application entry point
 """
 
+import asyncio
+import traceback
+from contextlib import asynccontextmanager, suppress
+
 from fastapi import FastAPI, WebSocket
 from fastapi.middleware.cors import CORSMiddleware
+from app.api.responses import ORJSONResponse
 from app.api.routes import router
-from app.api.websocket import websocket_endpoint
+from app.api.websocket import websocket_endpoint, simulation_loop
+
+
+def _report_loop_exit(task: asyncio.Task):
+    """Log the simulation loop ending by anything but shutdown"""
+    if task.cancelled():
+        return
+    error = task.exception()
+    if error is not None:
+        print(f"💥 Simulation loop crashed: {error!r}")
+        traceback.print_exception(error)
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Run a single simulation loop for the lifetime of the app"""
+    task = asyncio.create_task(simulation_loop())
+    task.add_done_callback(_report_loop_exit)
+    yield
+    task.cancel()
+    # A crash was already reported by _report_loop_exit
+    with suppress(asyncio.CancelledError, Exception):
+        await task
+
 
 # Initialize FastAPI app
 app = FastAPI(
     title="Renewable Grid Simulator API",
     description="Backend API for renewable energy grid simulation platform",
     version="0.1.0",
+    default_response_class=ORJSONResponse,
+    lifespan=lifespan,
 )
 
 # Configure CORS
@@ -44,10 +74,19 @@ async def websocket_route(websocket: WebSocket):
 
 if __name__ == "__main__":
     import uvicorn
+
+    # uvloop cuts per-send overhead on WebSocket broadcasts; it isn't
+    # available on Windows, so fall back to the stdlib loop there
+    try:
+        import uvloop  # noqa: F401
+        event_loop = "uvloop"
+    except ImportError:
+        event_loop = "asyncio"
     
     uvicorn.run(
         "main:app",
         host="0.0.0.0",
         port=8000,
         reload=True,
+        loop=event_loop,
     )
\ No newline at end of file
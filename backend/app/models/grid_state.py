@@ -3,12 +3,17 @@ Grid State Models
 
 These Pydantic models define the structure of the grid simulation data.
 They serve as the "single source of truth" for what data exists in the system.
+
+Fields that change every tick carry short serialization aliases. The
+WebSocket stream serializes with by_alias=True to keep frames small; REST
+responses use the full field names.
 """
 
-from pydantic import BaseModel, Field, computed_field
+from pydantic import BaseModel, ConfigDict, Field, computed_field, model_validator
 from typing import Optional
 from datetime import datetime
 from enum import Enum
+from functools import cached_property
 
 
 class EnergySourceType(str, Enum):
@@ -27,7 +32,17 @@ class EnergySourceStatus(str, Enum):
     STANDBY = "standby"
 
 
-class WeatherState(BaseModel):
+class SimulationModel(BaseModel):
+    """Base for models built by the simulation engine from trusted values"""
+    model_config = ConfigDict(
+        validate_assignment=False,
+        extra='ignore',
+        arbitrary_types_allowed=True,
+        ser_json_timedelta='iso8601'
+    )
+
+
+class WeatherState(SimulationModel):
     """Current weather conditions affecting the grid"""
     wind_speed: float = Field(
         ..., 
@@ -54,8 +69,8 @@ class WeatherState(BaseModel):
         description="Hour of day (0-24, decimal for minutes)"
     )
     
-    class Config:
-        json_schema_extra = {
+    model_config = ConfigDict(
+        json_schema_extra={
             "example": {
                 "wind_speed": 8.5,
                 "cloud_cover": 0.3,
@@ -63,43 +78,48 @@ class WeatherState(BaseModel):
                 "time_of_day": 14.5  # 2:30 PM
             }
         }
+    )
 
 
-class DemandState(BaseModel):
+class DemandState(SimulationModel):
     """Current power demand on the grid"""
     base_load: float = Field(
         ...,
         ge=0.0,
+        serialization_alias="bl",
         description="Base residential/commercial demand in MW"
     )
     industrial_load: float = Field(
         default=0.0,
         ge=0.0,
+        serialization_alias="il",
         description="Industrial demand in MW (can be toggled on/off)"
     )
     heating_cooling_load: float = Field(
         default=0.0,
         ge=0.0,
+        serialization_alias="hcl",
         description="Temperature-dependent heating/cooling load in MW"
     )
     
-    @computed_field
+    @computed_field(alias="td")
     @property
     def total_demand(self) -> float:
         """Calculate total power demand"""
         return self.base_load + self.industrial_load + self.heating_cooling_load
     
-    class Config:
-        json_schema_extra = {
+    model_config = ConfigDict(
+        json_schema_extra={
             "example": {
                 "base_load": 350.0,
                 "industrial_load": 50.0,
                 "heating_cooling_load": 30.0
             }
         }
+    )
 
 
-class EnergySource(BaseModel):
+class EnergySource(SimulationModel):
     """Base model for an energy source"""
     source_type: EnergySourceType
     status: EnergySourceStatus = EnergySourceStatus.ONLINE
@@ -110,9 +130,11 @@ class EnergySource(BaseModel):
     )
     current_output_mw: float = Field(
         default=0.0,
+        serialization_alias="out",
         description="Current power output in megawatts"
     )
     
+    @computed_field(alias="cf")
     @property
     def capacity_factor(self) -> float:
         """Percentage of capacity currently being used"""
@@ -120,8 +142,8 @@ class EnergySource(BaseModel):
             return 0.0
         return (self.current_output_mw / self.capacity_mw) * 100
     
-    class Config:
-        json_schema_extra = {
+    model_config = ConfigDict(
+        json_schema_extra={
             "example": {
                 "source_type": "wind",
                 "status": "online",
@@ -129,6 +151,7 @@ class EnergySource(BaseModel):
                 "current_output_mw": 320.0
             }
         }
+    )
 
 
 class WindTurbineState(EnergySource):
@@ -137,11 +160,16 @@ class WindTurbineState(EnergySource):
     num_turbines: int = Field(default=50, gt=0)
     turbine_capacity_mw: float = Field(default=9.0, gt=0.0)
     
-    def __init__(self, **data):
+    @model_validator(mode='before')
+    @classmethod
+    def _default_capacity(cls, data):
         # Auto-calculate total capacity if not provided
-        if 'capacity_mw' not in data:
-            data['capacity_mw'] = data.get('num_turbines', 50) * data.get('turbine_capacity_mw', 9.0)
-        super().__init__(**data)
+        if isinstance(data, dict) and 'capacity_mw' not in data:
+            data = {
+                **data,
+                'capacity_mw': data.get('num_turbines', 50) * data.get('turbine_capacity_mw', 9.0)
+            }
+        return data
 
 
 class SolarArrayState(EnergySource):
@@ -171,6 +199,7 @@ class BatteryState(EnergySource):
     current_charge_mwh: float = Field(
         default=0.0,
         ge=0.0,
+        serialization_alias="chg",
         description="Current stored energy in megawatt-hours"
     )
     max_charge_rate_mw: float = Field(
@@ -190,7 +219,7 @@ class BatteryState(EnergySource):
         description="Battery round-trip efficiency (0.95 = 95%)"
     )
     
-    @computed_field
+    @computed_field(alias="chg_pct")
     @property
     def charge_level_percent(self) -> float:
         """Battery charge as percentage of capacity"""
@@ -224,45 +253,89 @@ class GasPlantState(EnergySource):
     )
 
 
-class Metrics(BaseModel):
+class Metrics(SimulationModel):
     """Performance and sustainability metrics"""
     renewable_energy_percent: float = Field(
         default=0.0,
         ge=0.0,
+        serialization_alias="ren_pct",
         description="Percentage of demand met by renewable sources"
     )
     co2_emissions_kg: float = Field(
         default=0.0,
         ge=0.0,
+        serialization_alias="co2_kg",
         description="Total CO2 emissions in kilograms"
     )
     operational_cost_eur: float = Field(
         default=0.0,
         ge=0.0,
+        serialization_alias="cost_eur",
         description="Total fuel cost in EUR"
     )
     grid_uptime_percent: float = Field(
         default=100.0,
         ge=0.0,
         le=100.0,
+        serialization_alias="uptime_pct",
         description="Percentage of ticks where supply met demand"
     )
     gas_activation_count: int = Field(
         default=0,
         ge=0,
+        serialization_alias="gas_acts",
         description="Number of times gas plant was activated from standby"
     )
     battery_cycles: float = Field(
         default=0.0,
         ge=0.0,
+        serialization_alias="batt_cyc",
         description="Total battery charge/discharge cycles"
     )
-    
-class GridState(BaseModel):
+
+
+class _TickSnapshot:
+    """Grid-wide totals for one state, derived in a single pass"""
+    __slots__ = ("gen", "ren", "bal")
+
+    def __init__(self, gen: float, ren: float, bal: float):
+        self.gen = gen
+        self.ren = ren
+        self.bal = bal
+
+
+def compute_tick_metrics(
+    wind_out: float,
+    solar_out: float,
+    battery_out: float,
+    gas_out: float,
+    total_demand: float
+) -> _TickSnapshot:
+    """
+    Compute generation, renewable generation and balance together
+
+    Args:
+        wind_out: Wind output in MW
+        solar_out: Solar output in MW
+        battery_out: Battery output in MW (negative while charging)
+        gas_out: Gas output in MW
+        total_demand: Total demand in MW
+
+    Returns:
+        _TickSnapshot with gen, ren and bal in MW
+    """
+    renewable = wind_out + solar_out
+    gen = renewable + battery_out + gas_out
+    # Only battery discharge counts as renewable supply
+    ren = renewable + (battery_out if battery_out > 0 else 0.0)
+    return _TickSnapshot(gen, ren, gen - total_demand)
+
+
+class GridState(SimulationModel):
     """Complete state of the grid at a point in time"""
     timestamp: datetime = Field(
         default_factory=datetime.now,
-        description="When this state was captured"
+        description="Simulated time of this state (simulation start + elapsed ticks)"
     )
     simulation_day: int = Field(
         default=1,
@@ -285,41 +358,44 @@ class GridState(BaseModel):
     # Metrics
     metrics: Metrics = Field(default_factory=Metrics)
     
-    @computed_field
+    # States are built fresh every tick, so the totals are computed
+    # together on first access and shared by the computed fields below
+    @cached_property
+    def _totals(self) -> "_TickSnapshot":
+        return compute_tick_metrics(
+            self.wind.current_output_mw,
+            self.solar.current_output_mw,
+            self.battery.current_output_mw,
+            self.gas.current_output_mw,
+            self.demand.total_demand
+        )
+
+    @computed_field(alias="gen")
     @property
     def total_generation_mw(self) -> float:
         """Total power being generated right now"""
-        return (
-            self.wind.current_output_mw +
-            self.solar.current_output_mw +
-            self.battery.current_output_mw +  # Can be negative if charging
-            self.gas.current_output_mw
-        )
+        return self._totals.gen
 
+    @computed_field(alias="ren")
     @property
     def total_renewable_mw(self) -> float:
         """Total renewable power generation (wind + solar + battery discharge)"""
-        battery_contribution = max(0, self.battery.current_output_mw)
-        return (
-            self.wind.current_output_mw +
-            self.solar.current_output_mw +
-            battery_contribution
-        )
+        return self._totals.ren
 
-    @computed_field
+    @computed_field(alias="bal")
     @property
     def supply_demand_balance(self) -> float:
         """Difference between supply and demand (+ = surplus, - = deficit)"""
-        return self.total_generation_mw - self.demand.total_demand
+        return self._totals.bal
 
-    @computed_field
+    @computed_field(alias="stable")
     @property
     def is_grid_stable(self) -> bool:
         """Is the grid meeting demand?"""
-        return self.supply_demand_balance >= 0
+        return self._totals.bal >= 0
     
-    class Config:
-        json_schema_extra = {
+    model_config = ConfigDict(
+        json_schema_extra={
             "example": {
                 "timestamp": "2024-01-24T14:30:00",
                 "simulation_day": 1,
@@ -364,6 +440,7 @@ class GridState(BaseModel):
                 }
             }
         }
+    )
 
 
 # Example usage and testing
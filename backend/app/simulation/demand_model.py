@@ -5,11 +5,17 @@ Calculates power demand based on time of day, temperature, and load types.
 Residential demand peaks morning (8am) and evening (6pm).
 """
 
-import math
+import numpy as np
+
+from app.simulation.kernels import residential_curve, temperature_load
+from app.utils.fast_math import PI_OVER_12, PROFILE_BUCKETS_PER_HOUR, PROFILE_SIZE
 
 
 class DemandModel:
     """Power demand calculator"""
+
+    __slots__ = ('_base_load_mw', '_peak_multiplier', 'industrial_load_mw', 'industrial_enabled',
+                 '_resid_lut')
     
     def __init__(
         self,
@@ -25,10 +31,36 @@ class DemandModel:
             industrial_load_mw: Industrial facility load
             industrial_enabled: Is industrial load active?
         """
-        self.base_load_mw = base_load_mw
-        self.peak_multiplier = peak_multiplier
+        self._base_load_mw = base_load_mw
+        self._peak_multiplier = peak_multiplier
         self.industrial_load_mw = industrial_load_mw
         self.industrial_enabled = industrial_enabled
+        self._build_residential_lut()
+
+    @property
+    def base_load_mw(self) -> float:
+        return self._base_load_mw
+
+    @base_load_mw.setter
+    def base_load_mw(self, value: float):
+        self._base_load_mw = value
+        self._build_residential_lut()
+
+    @property
+    def peak_multiplier(self) -> float:
+        return self._peak_multiplier
+
+    @peak_multiplier.setter
+    def peak_multiplier(self, value: float):
+        self._peak_multiplier = value
+        self._build_residential_lut()
+
+    def _build_residential_lut(self):
+        """Tabulate the residential curve at every 15-minute mark of the day"""
+        self._resid_lut = [
+            residential_curve(i / PROFILE_BUCKETS_PER_HOUR, self._base_load_mw, self._peak_multiplier)
+            for i in range(PROFILE_SIZE)
+        ]
         
     def calculate_demand(
         self, 
@@ -63,67 +95,96 @@ class DemandModel:
             "total_demand": total
         }
     
+    def calculate_demand_batch(
+        self,
+        hours: np.ndarray,
+        temps: np.ndarray
+    ) -> dict:
+        """
+        Calculate total demand for many timesteps at once
+
+        Vectorized equivalent of calculate_demand for time-series sweeps.
+
+        Args:
+            hours: Array of hours (0-24)
+            temps: Array of temperatures in Celsius (same shape as hours)
+
+        Returns:
+            dict with demand breakdown, each value an array
+        """
+        hours = np.asarray(hours, dtype=np.float64)
+        temps = np.asarray(temps, dtype=np.float64)
+
+        # Residential demand curve (double peak: morning & evening)
+        morning = (hours >= 6) & (hours <= 10)
+        evening = (hours >= 16) & (hours <= 22)
+        night = ((hours >= 0) & (hours < 6)) | (hours >= 23)
+        morning_peak = np.where(morning, np.sin((hours - 8) * PI_OVER_12), 0.0)
+        evening_peak = np.where(evening, np.sin((hours - 18) * PI_OVER_12), 0.0)
+        peak_factor = np.maximum(morning_peak, evening_peak)
+        night_factor = np.where(night, 0.6, 1.0)
+        variation = (self.peak_multiplier - 1.0) * np.maximum(0.0, peak_factor)
+        residential = self.base_load_mw * night_factor * (1.0 + variation)
+
+        # Industrial (constant if enabled)
+        industrial_mw = self.industrial_load_mw if self.industrial_enabled else 0.0
+        industrial = np.full_like(hours, industrial_mw)
+
+        # Temperature-dependent heating/cooling, daytime only
+        daytime = (hours >= 6) & (hours < 22)
+        heating = np.clip((10 - temps) * 3.0, 0.0, 50.0)
+        cooling = np.clip((temps - 20) * 2.0, 0.0, 30.0)
+        heating_cooling = np.where(daytime, np.where(temps < 10, heating, cooling), 0.0)
+
+        return {
+            "base_load": residential,
+            "industrial_load": industrial,
+            "heating_cooling_load": heating_cooling,
+            "total_demand": residential + industrial + heating_cooling
+        }
+
     def _residential_curve(self, hour: float) -> float:
         """
         Residential load with morning and evening peaks
         Low at night (3am), peaks at 8am and 6pm
         """
-        # Two sine waves offset to create double peak
-        morning_peak = math.sin((hour - 8) * math.pi / 12) if 6 <= hour <= 10 else 0
-        evening_peak = math.sin((hour - 18) * math.pi / 12) if 16 <= hour <= 22 else 0
-        
-        # Night time reduction (3am is lowest)
-        night_factor = 0.6 if 0 <= hour < 6 or hour >= 23 else 1.0
-        
-        peak_factor = max(morning_peak, evening_peak)
-        variation = (self.peak_multiplier - 1.0) * max(0, peak_factor)
-        
-        return self.base_load_mw * night_factor * (1.0 + variation)
+        # Engine ticks land exactly on a table entry
+        pos = hour * PROFILE_BUCKETS_PER_HOUR
+        i = int(pos)
+        if pos == i and 0 <= i < PROFILE_SIZE:
+            return self._resid_lut[i]
+        return residential_curve(hour, self._base_load_mw, self._peak_multiplier)
     
     def _temperature_load(self, temp: float, hour: float) -> float:
         """
         Heating/cooling load based on temperature
         Only during daytime hours
         """
-        # No heating/cooling at night
-        if hour < 6 or hour >= 22:
-            return 0.0
-        
-        # Heating needed when cold (<10°C)
-        if temp < 10:
-            heating = (10 - temp) * 3.0  # 3MW per degree below 10°C
-            return min(heating, 50.0)  # Cap at 50MW
-        
-        # Cooling needed when hot (>20°C)
-        elif temp > 20:
-            cooling = (temp - 20) * 2.0  # 2MW per degree above 20°C
-            return min(cooling, 30.0)  # Cap at 30MW
-        
-        return 0.0
+        return temperature_load(temp, hour)
 
 
 # Test
 if __name__ == "__main__":
+    import sys
+
     demand = DemandModel(base_load_mw=300.0)
-    
-    print("Demand Model - Typical Winter Day (5°C)\n")
-    print("Time  | Residential | Industrial | Heating | Total")
-    print("-" * 60)
-    
-    for hour in range(0, 25, 2):
-        result = demand.calculate_demand(hour, 5.0)
-        print(f"{hour:02d}:00 | {result['base_load']:7.1f} MW | "
-              f"{result['industrial_load']:6.1f} MW | "
-              f"{result['heating_cooling_load']:5.1f} MW | "
-              f"{result['total_demand']:7.1f} MW")
-    
-    print("\n\nDemand Model - Hot Summer Day (28°C)\n")
-    print("Time  | Residential | Industrial | Cooling | Total")
-    print("-" * 60)
-    
-    for hour in range(0, 25, 2):
-        result = demand.calculate_demand(hour, 28.0)
-        print(f"{hour:02d}:00 | {result['base_load']:7.1f} MW | "
-              f"{result['industrial_load']:6.1f} MW | "
-              f"{result['heating_cooling_load']:5.1f} MW | "
-              f"{result['total_demand']:7.1f} MW")
\ No newline at end of file
+    hours = np.arange(0, 25, 2, dtype=np.float64)
+
+    days = (("Typical Winter Day (5°C)", 5.0, "Heating"),
+            ("Hot Summer Day (28°C)", 28.0, "Cooling"))
+
+    for i, (title, temp, label) in enumerate(days):
+        result = demand.calculate_demand_batch(hours, np.full_like(hours, temp))
+
+        if i:
+            print("\n")
+        print(f"Demand Model - {title}\n")
+        print(f"Time  | Residential | Industrial | {label} | Total")
+        print("-" * 60)
+        np.savetxt(
+            sys.stdout,
+            np.column_stack([hours, result["base_load"], result["industrial_load"],
+                             result["heating_cooling_load"], result["total_demand"]]),
+            fmt=["%02.0f:00", "%7.1f MW", "%6.1f MW", "%5.1f MW", "%7.1f MW"],
+            delimiter=" | "
+        )
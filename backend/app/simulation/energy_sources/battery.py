@@ -7,6 +7,9 @@ Handles charging, discharging, and efficiency losses.
 
 class Battery:
     """Battery energy storage system"""
+
+    __slots__ = ('max_capacity_mwh', 'max_charge_rate_mw', 'max_discharge_rate_mw',
+                 '_round_trip_efficiency', '_inv_eff', 'current_charge_mwh', 'total_cycles')
     
     def __init__(
         self,
@@ -27,9 +30,18 @@ class Battery:
         self.max_capacity_mwh = max_capacity_mwh
         self.max_charge_rate_mw = max_charge_rate_mw
         self.max_discharge_rate_mw = max_discharge_rate_mw
-        self.round_trip_efficiency = round_trip_efficiency
+        self.round_trip_efficiency = round_trip_efficiency  # also sets _inv_eff
         self.current_charge_mwh = min(initial_charge_mwh, max_capacity_mwh)
         self.total_cycles = 0.0
+
+    @property
+    def round_trip_efficiency(self) -> float:
+        return self._round_trip_efficiency
+
+    @round_trip_efficiency.setter
+    def round_trip_efficiency(self, value: float):
+        self._round_trip_efficiency = value
+        self._inv_eff = 1.0 / value
         
     def charge(self, power_mw: float, duration_hours: float) -> float:
         """
@@ -46,11 +58,13 @@ class Battery:
         actual_power = min(power_mw, self.max_charge_rate_mw)
         
         # Calculate energy with efficiency loss
-        energy_stored = actual_power * duration_hours * self.round_trip_efficiency
+        energy_stored = actual_power * duration_hours * self._round_trip_efficiency
         
         # Don't overcharge
         space_available = self.max_capacity_mwh - self.current_charge_mwh
-        energy_stored = min(energy_stored, space_available)
+        clipped = energy_stored > space_available
+        if clipped:
+            energy_stored = space_available
         
         # Update charge level
         self.current_charge_mwh += energy_stored
@@ -58,8 +72,13 @@ class Battery:
         # Track cycles (1 cycle = full charge/discharge)
         self.total_cycles += energy_stored / self.max_capacity_mwh
         
-        # Return actual power consumed from grid
-        return energy_stored / (duration_hours * self.round_trip_efficiency) if duration_hours > 0 else 0
+        # Return actual power consumed from grid; unless the battery
+        # filled up, that is the requested power
+        if duration_hours <= 0:
+            return 0.0
+        if not clipped:
+            return actual_power
+        return energy_stored * self._inv_eff / duration_hours
         
     def discharge(self, power_mw: float, duration_hours: float) -> float:
         """
@@ -76,7 +95,7 @@ class Battery:
         actual_power = min(power_mw, self.max_discharge_rate_mw)
         
         # Calculate energy needed (with efficiency loss)
-        energy_needed = actual_power * duration_hours / self.round_trip_efficiency
+        energy_needed = actual_power * duration_hours * self._inv_eff
         
         # Don't over-discharge
         energy_available = self.current_charge_mwh
@@ -88,8 +107,13 @@ class Battery:
         # Track cycles
         self.total_cycles += energy_used / self.max_capacity_mwh
         
-        # Return actual power supplied to grid
-        return energy_used * self.round_trip_efficiency / duration_hours if duration_hours > 0 else 0
+        # Return actual power supplied to grid; unless the battery ran
+        # dry, that is the requested power
+        if duration_hours <= 0:
+            return 0.0
+        if energy_used == energy_needed:
+            return actual_power
+        return energy_used * self._round_trip_efficiency / duration_hours
     
     @property
     def charge_percent(self) -> float:
@@ -106,6 +130,11 @@ class Battery:
         """Is battery depleted?"""
         return self.current_charge_mwh <= self.max_capacity_mwh * 0.05
 
+    def reset(self, initial_charge_mwh: float = 200.0):
+        """Restore the starting charge and clear the cycle count"""
+        self.current_charge_mwh = min(initial_charge_mwh, self.max_capacity_mwh)
+        self.total_cycles = 0.0
+
 
 # Test
 if __name__ == "__main__":
@@ -8,6 +8,10 @@ Tracks fuel costs and CO2 emissions.
 
 class GasPlant:
     """Natural gas backup power plant"""
+
+    __slots__ = ('capacity_mw', 'fuel_cost_per_mwh', 'co2_per_mwh_tons', '_ramp_rate_mw_per_min',
+                 '_ramp_per_hour', 'current_output_mw', 'total_runtime_hours',
+                 'total_fuel_cost_eur', 'total_co2_tons', 'activation_count')
     
     def __init__(
         self,
@@ -26,12 +30,21 @@ class GasPlant:
         self.capacity_mw = capacity_mw
         self.fuel_cost_per_mwh = fuel_cost_per_mwh
         self.co2_per_mwh_tons = co2_per_mwh_tons
-        self.ramp_rate_mw_per_min = ramp_rate_mw_per_min
+        self.ramp_rate_mw_per_min = ramp_rate_mw_per_min  # also sets _ramp_per_hour
         self.current_output_mw = 0.0
         self.total_runtime_hours = 0.0
         self.total_fuel_cost_eur = 0.0
         self.total_co2_tons = 0.0
         self.activation_count = 0
+
+    @property
+    def ramp_rate_mw_per_min(self) -> float:
+        return self._ramp_rate_mw_per_min
+
+    @ramp_rate_mw_per_min.setter
+    def ramp_rate_mw_per_min(self, value: float):
+        self._ramp_rate_mw_per_min = value
+        self._ramp_per_hour = value * 60.0
         
     def set_output(self, target_mw: float, duration_hours: float) -> float:
         """
@@ -45,20 +58,17 @@ class GasPlant:
             Actual output achieved
         """
         # Limit to capacity
-        target_mw = min(target_mw, self.capacity_mw)
-        
-        # Calculate max change based on ramp rate
-        duration_minutes = duration_hours * 60
-        max_change = self.ramp_rate_mw_per_min * duration_minutes
+        target_mw = target_mw if target_mw < self.capacity_mw else self.capacity_mw
         
-        # Apply ramp limit
-        if target_mw > self.current_output_mw:
-            actual_output = min(target_mw, self.current_output_mw + max_change)
-        else:
-            actual_output = max(target_mw, self.current_output_mw - max_change)
+        # Clamp to the ramp window around the current output
+        current = self.current_output_mw
+        max_change = self._ramp_per_hour * duration_hours
+        lo = current - max_change
+        hi = current + max_change
+        actual_output = hi if target_mw > hi else (lo if target_mw < lo else target_mw)
         
         # Track activation
-        if self.current_output_mw == 0 and actual_output > 0:
+        if current == 0 and actual_output > 0:
             self.activation_count += 1
         
         self.current_output_mw = actual_output
@@ -86,6 +96,14 @@ class GasPlant:
         """Current output as percentage of capacity"""
         return (self.current_output_mw / self.capacity_mw) * 100
 
+    def reset(self):
+        """Return to standby and clear the running totals"""
+        self.current_output_mw = 0.0
+        self.total_runtime_hours = 0.0
+        self.total_fuel_cost_eur = 0.0
+        self.total_co2_tons = 0.0
+        self.activation_count = 0
+
 
 # Test
 if __name__ == "__main__":
@@ -5,10 +5,37 @@ Calculates solar power output based on time of day and cloud cover.
 """
 
 import math
+from enum import IntEnum
+
+import numpy as np
+
+from app.utils.fast_math import PI_OVER_12, PROFILE_BUCKETS_PER_HOUR, PROFILE_SIZE
+
+
+# Fraction of output lost at full cloud cover
+_CLOUD_ATTENUATION = 0.8
+
+
+class SolarStatus(IntEnum):
+    """Sky condition over the array"""
+    NIGHT = 0
+    CLOUDY = 1
+    PARTLY_CLOUDY = 2
+    CLEAR = 3
+
+
+# Display names for SolarStatus values, used when emitting JSON
+STATUS_NAMES = ("nighttime", "cloudy", "partly_cloudy", "clear")
+
+# Enum attribute lookup costs more than the power math, so the hot path
+# returns these module-level aliases
+_NIGHT, _CLOUDY, _PARTLY_CLOUDY, _CLEAR = SolarStatus
 
 
 class SolarArray:
     """Solar panel array power generation calculator"""
+
+    __slots__ = ('_capacity_mw', 'panel_efficiency', '_power_lut')
     
     def __init__(
         self, 
@@ -20,14 +47,37 @@ class SolarArray:
             capacity_mw: Maximum power output at perfect conditions
             panel_efficiency: Solar panel efficiency (0.0-1.0)
         """
-        self.capacity_mw = capacity_mw
+        self._capacity_mw = capacity_mw
         self.panel_efficiency = panel_efficiency
+        self._build_power_lut()
+
+    @property
+    def capacity_mw(self) -> float:
+        return self._capacity_mw
+
+    @capacity_mw.setter
+    def capacity_mw(self, value: float):
+        self._capacity_mw = value
+        self._build_power_lut()
+
+    def _build_power_lut(self):
+        """Tabulate clear-sky output at every 15-minute mark of the day"""
+        self._power_lut = [
+            self._clear_sky_power(i / PROFILE_BUCKETS_PER_HOUR)
+            for i in range(PROFILE_SIZE)
+        ]
+
+    def _clear_sky_power(self, time_of_day: float) -> float:
+        """Output with no cloud cover (capacity x sun elevation)"""
+        if time_of_day < 6.0 or time_of_day >= 18.0:
+            return 0.0
+        return self._capacity_mw * math.sin((time_of_day - 6.0) * PI_OVER_12)
         
     def calculate_power(
         self, 
         time_of_day: float, 
         cloud_cover: float
-    ) -> tuple[float, str]:
+    ) -> tuple[float, SolarStatus]:
         """
         Calculate solar power output
         
@@ -36,37 +86,60 @@ class SolarArray:
             cloud_cover: Cloud coverage (0.0 = clear, 1.0 = overcast)
             
         Returns:
-            (power_output_mw, status_message)
+            (power_output_mw, status)
         """
         # Night time - no solar
         if time_of_day < 6.0 or time_of_day >= 18.0:
-            return 0.0, "nighttime"
-        
-        # Calculate sun elevation (0-1, peaks at solar noon)
-        hours_since_sunrise = time_of_day - 6.0
-        angle_radians = (hours_since_sunrise / 12.0) * math.pi
-        sun_elevation = math.sin(angle_radians)
+            return 0.0, _NIGHT
         
-        # Cloud cover reduces output
-        cloud_factor = 1.0 - (cloud_cover * 0.8)  # 80% reduction at full cloud
+        # Clear-sky power from sun elevation (peaks at solar noon);
+        # engine ticks land exactly on a table entry
+        pos = time_of_day * PROFILE_BUCKETS_PER_HOUR
+        i = int(pos)
+        if pos == i:
+            base_power = self._power_lut[i]
+        else:
+            base_power = self._clear_sky_power(time_of_day)
         
-        # Calculate power
-        base_power = self.capacity_mw * sun_elevation
-        actual_power = base_power * cloud_factor
+        # Cloud cover reduces output (80% reduction at full cloud)
+        actual_power = base_power * (1.0 - cloud_cover * _CLOUD_ATTENUATION)
         
         # Determine status
         if cloud_cover > 0.7:
-            status = "cloudy"
+            status = _CLOUDY
         elif cloud_cover > 0.3:
-            status = "partly_cloudy"
+            status = _PARTLY_CLOUDY
         else:
-            status = "clear"
+            status = _CLEAR
             
         return actual_power, status
 
+    def calculate_power_array(
+        self,
+        times_of_day: np.ndarray,
+        cloud_covers: np.ndarray
+    ) -> np.ndarray:
+        """
+        Calculate solar power output for many timesteps at once
+
+        Args:
+            times_of_day: Array of hours of day (0.0-24.0)
+            cloud_covers: Array of cloud coverage (0.0-1.0, same shape)
+
+        Returns:
+            Array of power outputs in MW
+        """
+        t = np.asarray(times_of_day, dtype=np.float64)
+        c = np.asarray(cloud_covers, dtype=np.float64)
+        daylight = (t >= 6.0) & (t < 18.0)
+        clear_sky = np.where(daylight, self._capacity_mw * np.sin((t - 6.0) * PI_OVER_12), 0.0)
+        return clear_sky * (1.0 - c * _CLOUD_ATTENUATION)
+
 
 # Test
 if __name__ == "__main__":
+    import sys
+
     solar = SolarArray(capacity_mw=200.0)
     
     print(f"Solar Array: {solar.capacity_mw}MW capacity\n")
@@ -74,10 +147,14 @@ if __name__ == "__main__":
     # Test throughout the day
     print("Time  | Clear Sky | Cloudy (50%) | Overcast (90%)")
     print("-" * 55)
-    
-    for hour in range(0, 25, 2):
-        power_clear, _ = solar.calculate_power(hour, 0.0)
-        power_cloudy, _ = solar.calculate_power(hour, 0.5)
-        power_overcast, _ = solar.calculate_power(hour, 0.9)
-        
-        print(f"{hour:02d}:00 | {power_clear:6.1f} MW | {power_cloudy:8.1f} MW | {power_overcast:10.1f} MW")
\ No newline at end of file
+
+    hours = np.arange(0, 25, 2, dtype=np.float64)
+    np.savetxt(
+        sys.stdout,
+        np.column_stack([hours] + [
+            solar.calculate_power_array(hours, np.full_like(hours, cloud))
+            for cloud in (0.0, 0.5, 0.9)
+        ]),
+        fmt=["%02.0f:00", "%6.1f MW", "%8.1f MW", "%10.1f MW"],
+        delimiter=" | "
+    )
@@ -5,16 +5,42 @@ Calculates power output based on wind speed using realistic power curves.
 Based on typical 9MW offshore wind turbine specifications.
 """
 
+from enum import IntEnum
 from typing import Tuple
 
+import numpy as np
+
+
+class WindStatus(IntEnum):
+    """Operating regime of the turbine array"""
+    INSUFFICIENT_WIND = 0
+    RAMPING = 1
+    RATED_POWER = 2
+    SHUTDOWN_STORM = 3
+
+
+# Display names for WindStatus values, used when emitting JSON
+STATUS_NAMES = ("insufficient_wind", "ramping", "rated_power", "shutdown_storm")
+
+# Enum attribute lookup costs more than the power math, so the hot path
+# returns these module-level aliases
+_INSUFFICIENT_WIND, _RAMPING, _RATED_POWER, _SHUTDOWN_STORM = WindStatus
+
 
 class WindTurbine:
     """Wind turbine power generation calculator"""
+
+    __slots__ = ('rated_power_mw', 'num_turbines', 'total_capacity_mw', '_power_lut')
     
     # Turbine specifications (typical 9MW offshore turbine)
     CUT_IN_SPEED = 3.0      # m/s - minimum wind to start generating
     RATED_SPEED = 12.0      # m/s - wind speed for maximum power
     CUT_OUT_SPEED = 25.0    # m/s - maximum safe wind speed
+
+    # Power curve table: 256 bins of 0.125 m/s over 0-32 m/s, so cut-in,
+    # rated and cut-out speeds all fall on bin edges
+    LUT_BINS = 256
+    LUT_BINS_PER_MS = 8.0
     
     def __init__(self, rated_power_mw: float = 9.0, num_turbines: int = 50):
         """
@@ -25,8 +51,9 @@ class WindTurbine:
         self.rated_power_mw = rated_power_mw
         self.num_turbines = num_turbines
         self.total_capacity_mw = rated_power_mw * num_turbines
+        self._power_lut = self.calculate_power_array(np.arange(self.LUT_BINS) / self.LUT_BINS_PER_MS)
         
-    def calculate_power(self, wind_speed: float) -> Tuple[float, str]:
+    def calculate_power(self, wind_speed: float) -> Tuple[float, WindStatus]:
         """
         Calculate total power output for all turbines
         
@@ -34,19 +61,19 @@ class WindTurbine:
             wind_speed: Wind speed in m/s
             
         Returns:
-            (power_output_mw, status_message)
+            (power_output_mw, status)
         """
         # Safety shutdown - wind too strong
         if wind_speed >= self.CUT_OUT_SPEED:
-            return 0.0, "shutdown_storm"
+            return 0.0, _SHUTDOWN_STORM
         
         # Too little wind to generate
         if wind_speed < self.CUT_IN_SPEED:
-            return 0.0, "insufficient_wind"
+            return 0.0, _INSUFFICIENT_WIND
         
         # Optimal range - rated power
         if self.RATED_SPEED <= wind_speed < self.CUT_OUT_SPEED:
-            return self.total_capacity_mw, "rated_power"
+            return self.total_capacity_mw, _RATED_POWER
         
         # Ramp-up range (3-12 m/s) - cubic relationship
         # Power increases with cube of wind speed in this range
@@ -54,8 +81,50 @@ class WindTurbine:
                          (self.RATED_SPEED - self.CUT_IN_SPEED)) ** 3
         power_output = self.total_capacity_mw * power_fraction
         
-        return power_output, "ramping"
-    
+        return power_output, _RAMPING
+
+    def calculate_power_array(self, wind_speeds: np.ndarray) -> np.ndarray:
+        """
+        Calculate total power output for many wind speeds at once
+
+        Args:
+            wind_speeds: Array of wind speeds in m/s
+
+        Returns:
+            Array of power outputs in MW
+        """
+        v = np.asarray(wind_speeds, dtype=np.float64)
+        frac = np.clip((v - self.CUT_IN_SPEED) / (self.RATED_SPEED - self.CUT_IN_SPEED), 0.0, 1.0)
+        return self.total_capacity_mw * frac * frac * frac * (v < self.CUT_OUT_SPEED)
+
+    def calculate_power_binned(self, wind_speeds: np.ndarray) -> np.ndarray:
+        """
+        Power output for many wind speeds from the precomputed curve table
+
+        Each speed is rounded down to its 0.125 m/s bin, so output is
+        slightly low inside the cubic ramp (at most ~4% of capacity just
+        below rated speed) but exact on the flat sections and at the
+        cut-in/cut-out edges. Use calculate_power_array when exact
+        values matter.
+
+        Args:
+            wind_speeds: Array of wind speeds in m/s
+
+        Returns:
+            Array of power outputs in MW
+        """
+        bins = (np.asarray(wind_speeds, dtype=np.float64) * self.LUT_BINS_PER_MS).astype(np.int64)
+        return np.take(self._power_lut, bins, mode="clip")
+
+    def status_array(self, wind_speeds: np.ndarray) -> np.ndarray:
+        """WindStatus values matching calculate_power_array"""
+        v = np.asarray(wind_speeds, dtype=np.float64)
+        return np.select(
+            [v >= self.CUT_OUT_SPEED, v < self.CUT_IN_SPEED, v >= self.RATED_SPEED],
+            [WindStatus.SHUTDOWN_STORM, WindStatus.INSUFFICIENT_WIND, WindStatus.RATED_POWER],
+            default=WindStatus.RAMPING
+        ).astype(np.int8)
+
     def get_capacity_factor(self, wind_speed: float) -> float:
         """
         Calculate capacity factor (percentage of max power)
@@ -74,6 +143,8 @@ class WindTurbine:
 
 # Test the turbine model
 if __name__ == "__main__":
+    import sys
+
     turbine = WindTurbine(rated_power_mw=9.0, num_turbines=50)
     
     print(f"Wind Turbine Array: {turbine.num_turbines}x {turbine.rated_power_mw}MW")
@@ -82,9 +153,15 @@ if __name__ == "__main__":
     # Test at different wind speeds
     test_speeds = [0, 2, 3, 5, 8, 12, 15, 20, 25, 30]
     
+    speeds = np.array(test_speeds, dtype=np.float64)
+    power = turbine.calculate_power_array(speeds)
+    rows = np.rec.fromarrays([
+        speeds,
+        power,
+        power / turbine.total_capacity_mw * 100,
+        np.array(STATUS_NAMES)[turbine.status_array(speeds)],
+    ])
+
     print("Wind Speed | Power Output | Status")
     print("-" * 50)
-    for speed in test_speeds:
-        power, status = turbine.calculate_power(speed)
-        capacity = turbine.get_capacity_factor(speed)
-        print(f"{speed:4.0f} m/s   | {power:6.1f} MW ({capacity:5.1f}%) | {status}")
\ No newline at end of file
+    np.savetxt(sys.stdout, rows, fmt=["%4.0f m/s   | ", "%6.1f MW ", "(%5.1f%%) | ", "%s"], delimiter="")
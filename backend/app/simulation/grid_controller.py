@@ -5,9 +5,37 @@ The "brain" of the simulation - balances supply and demand automatically.
 Prioritizes renewables, uses battery smartly, activates gas as last resort.
 """
 
+from typing import TYPE_CHECKING, NamedTuple
+
+import numpy as np
+import numpy.typing as npt
+
+if TYPE_CHECKING:  # this module also runs as a script, see the test below
+    from app.simulation.energy_sources.battery import Battery
+    from app.simulation.energy_sources.gas_plant import GasPlant
+
+
+class BalanceResult(NamedTuple):
+    """Outcome of one balancing step"""
+    demand: float
+    wind_output: float
+    solar_output: float
+    battery_action: float  # + discharge, - charge
+    gas_output: float
+    total_supply: float
+    balance: float
+    renewable_percent: float
+    grid_stable: bool
+
 
 class GridController:
     """Intelligent grid balancing system"""
+
+    __slots__ = ('gas_active',)
+
+    # Shortest run balance_grid_batch hands to NumPy; shorter ones are
+    # cheaper tick by tick
+    MIN_BATCH_RUN = 16
     
     def __init__(self):
         self.gas_active = False
@@ -17,10 +45,10 @@ class GridController:
         demand_mw: float,
         wind_output: float,
         solar_output: float,
-        battery,
-        gas_plant,
+        battery: "Battery",
+        gas_plant: "GasPlant",
         duration_hours: float = 0.25  # 15 min default
-    ) -> dict:
+    ) -> BalanceResult:
         """
         Balance supply and demand
         
@@ -33,7 +61,7 @@ class GridController:
             duration_hours: Time period
             
         Returns:
-            dict with balancing results
+            BalanceResult with balancing results
         """
         # Calculate renewable supply
         renewable_supply = wind_output + solar_output
@@ -69,23 +97,160 @@ class GridController:
         
         # Calculate metrics
         total_supply = renewable_supply + battery_action + gas_output
-        renewable_percent = 0.0
-        if total_supply > 0:
-            renewable_contribution = renewable_supply + max(0, battery_action)
-            renewable_percent = (renewable_contribution / total_supply) * 100
+        renewable_contribution = renewable_supply + (battery_action if battery_action > 0 else 0.0)
+        renewable_percent = (renewable_contribution / total_supply) * 100 if total_supply > 0 else 0.0
         
-        return {
-            "demand": demand_mw,
-            "wind_output": wind_output,
-            "solar_output": solar_output,
-            "battery_action": battery_action,  # + discharge, - charge
-            "gas_output": gas_output,
-            "total_supply": total_supply,
-            "balance": total_supply - demand_mw,
-            "renewable_percent": renewable_percent,
-            "grid_stable": total_supply >= demand_mw
-        }
+        return BalanceResult(
+            demand_mw,
+            wind_output,
+            solar_output,
+            battery_action,
+            gas_output,
+            total_supply,
+            total_supply - demand_mw,
+            renewable_percent,
+            total_supply >= demand_mw
+        )
+
+
+    def balance_grid_batch(
+        self,
+        demands_mw: npt.ArrayLike,
+        wind_outputs: npt.ArrayLike,
+        solar_outputs: npt.ArrayLike,
+        battery: "Battery",
+        gas_plant: "GasPlant",
+        duration_hours: npt.ArrayLike = 0.25
+    ) -> BalanceResult:
+        """
+        Balance supply and demand over many consecutive ticks
+
+        Runs of ticks in which the battery neither fills up nor runs dry
+        and the gas plant stays off are applied as NumPy array updates.
+        Each tick that breaks a run goes through balance_grid. Battery
+        and gas state end up as if balance_grid had been called per tick.
+
+        Args:
+            demands_mw: Array of total power demand
+            wind_outputs: Array of available wind power
+            solar_outputs: Array of available solar power
+            battery: Battery object
+            gas_plant: GasPlant object
+            duration_hours: Time period per tick (scalar or array)
+
+        Returns:
+            BalanceResult whose fields are per-tick arrays
+        """
+        demand = np.asarray(demands_mw, dtype=np.float64)
+        wind = np.asarray(wind_outputs, dtype=np.float64)
+        solar = np.asarray(solar_outputs, dtype=np.float64)
+        n = len(demand)
+        dt = np.broadcast_to(np.asarray(duration_hours, dtype=np.float64), (n,))
+
+        renewable = wind + solar
+        balance = renewable - demand
+        surplus = balance > 0
+        deficit = np.abs(balance)
+
+        # Battery power and energy per tick, assuming nothing clips
+        efficiency = battery.round_trip_efficiency
+        power = np.where(
+            surplus,
+            np.minimum(balance, battery.max_charge_rate_mw),
+            np.minimum(deficit, battery.max_discharge_rate_mw)
+        )
+        energy = np.where(surplus, power * dt * efficiency, power * dt * (1.0 / efficiency))
+        delta = np.where(surplus, energy, -energy)
+
+        # Ticks that can join a run, as long as the battery doesn't clip:
+        # surplus leaves gas alone, small deficits hold it at zero
+        quiet = (dt > 0) & (surplus | (deficit - power <= 0.1))
+        ticks = np.arange(n)
+        stops = np.append(np.flatnonzero(~quiet), n)
+        next_stop = stops[np.searchsorted(stops, ticks)].tolist()
+        # A full battery absorbs nothing, so surplus runs leave it unchanged
+        stops = np.append(np.flatnonzero(~(surplus & (dt > 0))), n)
+        next_deficit = stops[np.searchsorted(stops, ticks)].tolist()
+        surplus_list = surplus.tolist()
+        energy_list = energy.tolist()
+        demand_list = demand.tolist()
+        wind_list = wind.tolist()
+        solar_list = solar.tolist()
+        dt_list = dt.tolist()
+
+        battery_action = np.empty(n)
+        gas_output = np.zeros(n)
+        capacity = battery.max_capacity_mwh
+
+        i = 0
+        window = self.MIN_BATCH_RUN
+        while i < n:
+            charge_now = battery.current_charge_mwh
+            if surplus_list[i] and charge_now >= capacity and dt_list[i] > 0:
+                k = next_deficit[i]
+                battery_action[i:k] = -0.0
+                i = k
+                continue
+
+            end = min(i + window, next_stop[i])
+            if surplus_list[i]:
+                fits = energy_list[i] <= capacity - charge_now
+            else:
+                fits = energy_list[i] <= charge_now and gas_plant.current_output_mw == 0
+
+            if end - i < self.MIN_BATCH_RUN or not fits:
+                # Short run or breakpoint: battery clips or gas changes state
+                result = self.balance_grid(
+                    demand_list[i], wind_list[i], solar_list[i],
+                    battery, gas_plant, dt_list[i]
+                )
+                battery_action[i] = result.battery_action
+                gas_output[i] = result.gas_output
+                i += 1
+                window = self.MIN_BATCH_RUN
+                continue
+
+            # Charge before each tick, summed in tick order like balance_grid
+            charge = np.cumsum(np.concatenate(([charge_now], delta[i:end])))
+            ok = np.where(
+                surplus[i:end],
+                energy[i:end] <= capacity - charge[:-1],
+                energy[i:end] <= charge[:-1]
+            )
+            if gas_plant.current_output_mw != 0:
+                ok &= surplus[i:end]
+            run = end - i if ok.all() else int(np.argmin(ok))
+
+            k = i + run
+            battery_action[i:k] = np.where(surplus[i:k], -power[i:k], power[i:k])
+            battery.current_charge_mwh = float(charge[run])
+            battery.total_cycles = float(
+                np.cumsum(np.concatenate(([battery.total_cycles], energy[i:k] / capacity)))[-1]
+            )
+            if not surplus[i:k].all():
+                self.gas_active = False
+            window = window * 2 if k == end else self.MIN_BATCH_RUN
+            i = k
+
+        # Calculate metrics
+        total_supply = renewable + battery_action + gas_output
+        renewable_contribution = renewable + np.maximum(0, battery_action)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            renewable_percent = np.where(
+                total_supply > 0, (renewable_contribution / total_supply) * 100, 0.0
+            )
 
+        return BalanceResult(
+            demand,
+            wind,
+            solar,
+            battery_action,
+            gas_output,
+            total_supply,
+            total_supply - demand,
+            renewable_percent,
+            total_supply >= demand
+        )
 
 # Test
 if __name__ == "__main__":
@@ -107,11 +272,11 @@ if __name__ == "__main__":
         battery=battery,
         gas_plant=gas
     )
-    print(f"  Demand: {result['demand']:.1f} MW")
-    print(f"  Supply: {result['total_supply']:.1f} MW")
-    print(f"  Battery: {result['battery_action']:.1f} MW (charging)")
-    print(f"  Gas: {result['gas_output']:.1f} MW")
-    print(f"  Renewable: {result['renewable_percent']:.1f}%\n")
+    print(f"  Demand: {result.demand:.1f} MW")
+    print(f"  Supply: {result.total_supply:.1f} MW")
+    print(f"  Battery: {result.battery_action:.1f} MW (charging)")
+    print(f"  Gas: {result.gas_output:.1f} MW")
+    print(f"  Renewable: {result.renewable_percent:.1f}%\n")
     
     # Scenario 2: Deficit (low wind, use battery)
     print("Scenario 2: Low wind, discharge battery")
@@ -122,11 +287,11 @@ if __name__ == "__main__":
         battery=battery,
         gas_plant=gas
     )
-    print(f"  Demand: {result['demand']:.1f} MW")
-    print(f"  Supply: {result['total_supply']:.1f} MW")
-    print(f"  Battery: {result['battery_action']:.1f} MW (discharging)")
-    print(f"  Gas: {result['gas_output']:.1f} MW")
-    print(f"  Renewable: {result['renewable_percent']:.1f}%\n")
+    print(f"  Demand: {result.demand:.1f} MW")
+    print(f"  Supply: {result.total_supply:.1f} MW")
+    print(f"  Battery: {result.battery_action:.1f} MW (discharging)")
+    print(f"  Gas: {result.gas_output:.1f} MW")
+    print(f"  Renewable: {result.renewable_percent:.1f}%\n")
     
     # Scenario 3: Big deficit (need gas)
     print("Scenario 3: Very low wind, need gas backup")
@@ -137,8 +302,8 @@ if __name__ == "__main__":
         battery=battery,
         gas_plant=gas
     )
-    print(f"  Demand: {result['demand']:.1f} MW")
-    print(f"  Supply: {result['total_supply']:.1f} MW")
-    print(f"  Battery: {result['battery_action']:.1f} MW")
-    print(f"  Gas: {result['gas_output']:.1f} MW")
-    print(f"  Renewable: {result['renewable_percent']:.1f}%")
\ No newline at end of file
+    print(f"  Demand: {result.demand:.1f} MW")
+    print(f"  Supply: {result.total_supply:.1f} MW")
+    print(f"  Battery: {result.battery_action:.1f} MW")
+    print(f"  Gas: {result.gas_output:.1f} MW")
+    print(f"  Renewable: {result.renewable_percent:.1f}%")
\ No newline at end of file
@@ -0,0 +1,346 @@
+"""
+Simulation Kernels
+
+Numba-compiled scalar physics for every grid component, plus a fused
+time-series loop that runs many ticks without returning to Python.
+
+Each function mirrors the method of the same name on the OO classes;
+state that the classes keep on self is passed in and handed back.
+"""
+
+import math
+
+import numpy as np
+from numba import float64, njit, prange, types
+
+from app.utils.fast_math import PI_OVER_12, fast_sin_0_pi
+
+
+# Wind turbine power curve (see WindTurbine)
+WIND_CUT_IN_SPEED = 3.0
+WIND_RATED_SPEED = 12.0
+WIND_CUT_OUT_SPEED = 25.0
+
+# Battery/gas state tuple layout used by simulate_timeseries
+STATE_FIELDS = (
+    "current_charge_mwh",
+    "total_cycles",
+    "gas_output_mw",
+    "gas_runtime_hours",
+    "gas_fuel_cost_eur",
+    "gas_co2_tons",
+    "gas_activation_count",
+)
+
+# Parameter tuple layout used by simulate_timeseries
+PARAM_FIELDS = (
+    "wind_capacity_mw",
+    "solar_capacity_mw",
+    "base_load_mw",
+    "peak_multiplier",
+    "industrial_load_mw",
+    "battery_max_capacity_mwh",
+    "battery_max_charge_rate_mw",
+    "battery_max_discharge_rate_mw",
+    "battery_efficiency",
+    "gas_capacity_mw",
+    "gas_ramp_rate_mw_per_min",
+    "gas_fuel_cost_per_mwh",
+    "gas_co2_per_mwh_tons",
+    "duration_hours",
+)
+
+# Per-tick inputs and outputs of the batch kernels. Single precision is
+# far below the model's own error and halves memory traffic; the physics
+# and every running total (charge, cycles, cost, CO2) stay float64.
+#
+# Rounded records must not be turned back into GridState: its derived
+# totals (supply - demand, is_grid_stable) are recomputed from the
+# components and no longer balance once those are rounded separately.
+BATCH_DTYPE = np.float32
+
+
+def _timeseries_dtype(value_dtype) -> np.dtype:
+    """Per-tick record layout written by simulate_timeseries"""
+    return np.dtype([
+        ("wind_output", value_dtype),
+        ("solar_output", value_dtype),
+        ("total_demand", value_dtype),
+        ("total_supply", value_dtype),
+        ("gas_output", value_dtype),
+        ("battery_action", value_dtype),  # + discharge, - charge
+        ("renewable_percent", value_dtype),
+        ("battery_charge_mwh", value_dtype),
+        ("grid_stable", "?"),
+    ])
+
+
+# One record per tick written by simulate_timeseries
+TIMESERIES_DTYPE = _timeseries_dtype(BATCH_DTYPE)
+
+# The same records at full precision, for results the engine builds
+# GridStates from; simulate_timeseries accepts either layout
+STATE_TIMESERIES_DTYPE = _timeseries_dtype(np.float64)
+
+# Last axis of the array written by sweep
+SWEEP_FIELDS = TIMESERIES_DTYPE.names
+
+
+@njit(cache=True, fastmath=True)
+def residential_curve(hour: float, base_load: float, peak_mul: float) -> float:
+    # Two sine waves offset to create double peak, each masked to its
+    # window. The table sine is 0 outside [0, π], so both are >= 0.
+    morning_peak = fast_sin_0_pi((hour - 8) * PI_OVER_12) * (6 <= hour <= 10)
+    evening_peak = fast_sin_0_pi((hour - 18) * PI_OVER_12) * (16 <= hour <= 22)
+
+    # Night time reduction (3am is lowest)
+    night_factor = 0.6 if 0 <= hour < 6 or hour >= 23 else 1.0
+
+    variation = (peak_mul - 1.0) * max(morning_peak, evening_peak)
+
+    return base_load * night_factor * (1.0 + variation)
+
+
+@njit(cache=True, fastmath=True)
+def temperature_load(temp: float, hour: float) -> float:
+    # No heating/cooling at night
+    if hour < 6 or hour >= 22:
+        return 0.0
+
+    # Heating needed when cold (<10°C)
+    if temp < 10:
+        heating = (10 - temp) * 3.0  # 3MW per degree below 10°C
+        return min(heating, 50.0)  # Cap at 50MW
+
+    # Cooling needed when hot (>20°C)
+    elif temp > 20:
+        cooling = (temp - 20) * 2.0  # 2MW per degree above 20°C
+        return min(cooling, 30.0)  # Cap at 30MW
+
+    return 0.0
+
+
+@njit(cache=True)
+def wind_power(wind_speed: float, total_capacity_mw: float) -> float:
+    # Clipped cube, zeroed at and above cut-out
+    frac = (wind_speed - WIND_CUT_IN_SPEED) / (WIND_RATED_SPEED - WIND_CUT_IN_SPEED)
+    frac = min(max(frac, 0.0), 1.0)
+    return total_capacity_mw * frac * frac * frac * (wind_speed < WIND_CUT_OUT_SPEED)
+
+
+@njit(cache=True)
+def solar_power(time_of_day: float, cloud_cover: float, capacity_mw: float) -> float:
+    # Night time - no solar
+    if time_of_day < 6.0 or time_of_day >= 18.0:
+        return 0.0
+
+    base_power = capacity_mw * math.sin((time_of_day - 6.0) * PI_OVER_12)
+
+    # 80% reduction at full cloud
+    return base_power * (1.0 - cloud_cover * 0.8)
+
+
+# Compiled eagerly for float64 so int weather values (e.g. after
+# set_wind(0)) are converted instead of triggering a new specialization
+@njit(types.UniTuple(float64, 5)(float64, float64, float64, float64, float64,
+                                 float64, float64, float64, float64), cache=True)
+def physics_step(hour, temp, wind_speed, cloud, wind_capacity_mw, solar_capacity_mw,
+                 base_load, peak_mul, industrial_load_mw):
+    """
+    Generation and demand for one tick
+
+    Returns:
+        (wind MW, solar MW, residential MW, industrial MW,
+         heating/cooling MW)
+    """
+    return (
+        wind_power(wind_speed, wind_capacity_mw),
+        solar_power(hour, cloud, solar_capacity_mw),
+        residential_curve(hour, base_load, peak_mul),
+        industrial_load_mw,
+        temperature_load(temp, hour),
+    )
+
+
+@njit(cache=True)
+def battery_charge(power_mw, duration_hours, charge_mwh, cycles,
+                   max_capacity_mwh, max_charge_rate_mw, efficiency):
+    """Returns (power consumed, new charge, new cycle count)"""
+    actual_power = min(power_mw, max_charge_rate_mw)
+    energy_stored = actual_power * duration_hours * efficiency
+
+    # Don't overcharge
+    space_available = max_capacity_mwh - charge_mwh
+    clipped = energy_stored > space_available
+    if clipped:
+        energy_stored = space_available
+
+    charge_mwh += energy_stored
+    cycles += energy_stored / max_capacity_mwh
+
+    if duration_hours <= 0:
+        return 0.0, charge_mwh, cycles
+    if not clipped:
+        return actual_power, charge_mwh, cycles
+    return energy_stored * (1.0 / efficiency) / duration_hours, charge_mwh, cycles
+
+
+@njit(cache=True)
+def battery_discharge(power_mw, duration_hours, charge_mwh, cycles,
+                      max_capacity_mwh, max_discharge_rate_mw, efficiency):
+    """Returns (power supplied, new charge, new cycle count)"""
+    actual_power = min(power_mw, max_discharge_rate_mw)
+    energy_needed = actual_power * duration_hours * (1.0 / efficiency)
+
+    # Don't over-discharge
+    energy_used = min(energy_needed, charge_mwh)
+
+    charge_mwh -= energy_used
+    cycles += energy_used / max_capacity_mwh
+
+    if duration_hours <= 0:
+        return 0.0, charge_mwh, cycles
+    if energy_used == energy_needed:
+        return actual_power, charge_mwh, cycles
+    return energy_used * efficiency / duration_hours, charge_mwh, cycles
+
+
+@njit(cache=True)
+def gas_set_output(target_mw, duration_hours, output_mw, runtime_hours,
+                   fuel_cost_eur, co2_tons, activations,
+                   capacity_mw, ramp_rate_mw_per_min, fuel_cost_per_mwh,
+                   co2_per_mwh_tons):
+    """Returns (new output, runtime, fuel cost, CO2, activation count)"""
+    target_mw = min(target_mw, capacity_mw)
+
+    # Clamp to the ramp window around the current output
+    max_change = (ramp_rate_mw_per_min * 60.0) * duration_hours
+    actual_output = min(max(target_mw, output_mw - max_change), output_mw + max_change)
+
+    if output_mw == 0 and actual_output > 0:
+        activations += 1
+
+    # Track costs and emissions if running
+    if actual_output > 0:
+        energy_mwh = actual_output * duration_hours
+        runtime_hours += duration_hours
+        fuel_cost_eur += energy_mwh * fuel_cost_per_mwh
+        co2_tons += energy_mwh * co2_per_mwh_tons
+
+    return actual_output, runtime_hours, fuel_cost_eur, co2_tons, activations
+
+
+@njit(cache=True)
+def grid_step(hour, temp, wind_speed, cloud, p, s):
+    """
+    Generation, demand and grid balancing for one tick
+
+    p is indexable in PARAM_FIELDS order and s is a state tuple in
+    STATE_FIELDS order.
+
+    Returns:
+        (outputs in SWEEP_FIELDS order, new state tuple)
+    """
+    charge, cycles, gas_now, runtime, fuel_cost, co2, activations = s
+    dt = p[13]
+
+    wind = wind_power(wind_speed, p[0])
+    solar = solar_power(hour, cloud, p[1])
+    demand = residential_curve(hour, p[2], p[3]) + p[4] + temperature_load(temp, hour)
+
+    renewable = wind + solar
+    balance = renewable - demand
+    batt = 0.0
+    gas = 0.0
+
+    # Surplus charges the battery; deficit drains it, then gas
+    if balance > 0:
+        charged, charge, cycles = battery_charge(
+            balance, dt, charge, cycles, p[5], p[6], p[8])
+        batt = -charged
+    else:
+        deficit = abs(balance)
+        batt, charge, cycles = battery_discharge(
+            deficit, dt, charge, cycles, p[5], p[7], p[8])
+        deficit -= batt
+
+        target = deficit if deficit > 0.1 else 0.0  # Small tolerance
+        gas_now, runtime, fuel_cost, co2, activations = gas_set_output(
+            target, dt, gas_now, runtime, fuel_cost, co2, activations,
+            p[9], p[10], p[11], p[12])
+        if target > 0:
+            gas = gas_now
+
+    supply = renewable + batt + gas
+    renew_pct = (renewable + max(batt, 0.0)) / supply * 100 if supply > 0 else 0.0
+
+    return ((wind, solar, demand, supply, gas, batt, renew_pct, charge, supply >= demand),
+            (charge, cycles, gas_now, runtime, fuel_cost, co2, activations))
+
+
+@njit(cache=True)
+def simulate_timeseries(n, hours, temps, winds, clouds, params, state, out):
+    """
+    Run n ticks of generation, demand and grid balancing in one loop
+
+    Inputs are per-tick arrays; results are written in place into out, a
+    TIMESERIES_DTYPE record array. params and state are tuples laid out
+    as PARAM_FIELDS and STATE_FIELDS.
+
+    Returns:
+        Final state tuple, in STATE_FIELDS order
+    """
+    charge, cycles, gas_now, runtime, fuel_cost, co2, activations = state
+    state = (charge, cycles, gas_now, runtime, fuel_cost, co2, np.int64(activations))
+
+    for i in range(n):
+        values, state = grid_step(hours[i], temps[i], winds[i], clouds[i], params, state)
+
+        rec = out[i]
+        rec.wind_output = values[0]
+        rec.solar_output = values[1]
+        rec.total_demand = values[2]
+        rec.total_supply = values[3]
+        rec.gas_output = values[4]
+        rec.battery_action = values[5]
+        rec.renewable_percent = values[6]
+        rec.battery_charge_mwh = values[7]
+        rec.grid_stable = values[8]
+
+    return state
+
+
+@njit(cache=True, parallel=True)
+def sweep(hours, temps, winds, clouds, params, states, out):
+    """
+    Run independent scenarios in parallel, one thread per scenario
+
+    Inputs are (N, T) arrays; params is (N, len(PARAM_FIELDS)) and
+    states is (N, len(STATE_FIELDS)), updated in place to each
+    scenario's final state. Results go into out, shaped
+    (N, T, len(SWEEP_FIELDS)).
+    """
+    n_scenarios, n_ticks = hours.shape
+    for k in prange(n_scenarios):
+        p = params[k]
+        s = states[k]
+        state = (s[0], s[1], s[2], s[3], s[4], s[5], s[6])
+        for i in range(n_ticks):
+            values, state = grid_step(hours[k, i], temps[k, i], winds[k, i], clouds[k, i], p, state)
+            row = out[k, i]
+            row[0] = values[0]
+            row[1] = values[1]
+            row[2] = values[2]
+            row[3] = values[3]
+            row[4] = values[4]
+            row[5] = values[5]
+            row[6] = values[6]
+            row[7] = values[7]
+            row[8] = 1.0 if values[8] else 0.0
+        s[0] = state[0]
+        s[1] = state[1]
+        s[2] = state[2]
+        s[3] = state[3]
+        s[4] = state[4]
+        s[5] = state[5]
+        s[6] = state[6]
@@ -4,12 +4,16 @@ Simulation Engine
 Orchestrates all components - runs the simulation tick by tick.
 """
 
-from datetime import datetime
-from app.models.grid_state import (
-    GridState, WeatherState, DemandState,
-    WindTurbineState, SolarArrayState, BatteryState, GasPlantState,
-    Metrics, EnergySourceStatus
-)
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime, timedelta
+from enum import IntEnum
+from typing import Iterable, Optional
+
+import numpy as np
+
+from app.models.grid_state import GridState, EnergySourceStatus
 from app.simulation.time_manager import TimeManager
 from app.simulation.weather_system import WeatherSystem
 from app.simulation.demand_model import DemandModel
@@ -18,20 +22,63 @@ from app.simulation.energy_sources.wind_turbine import WindTurbine
 from app.simulation.energy_sources.solar_array import SolarArray
 from app.simulation.energy_sources.battery import Battery
 from app.simulation.energy_sources.gas_plant import GasPlant
+from app.simulation.kernels import (
+    BATCH_DTYPE, STATE_TIMESERIES_DTYPE, SWEEP_FIELDS, TIMESERIES_DTYPE, physics_step,
+    simulate_timeseries, sweep
+)
+
+
+class Metric(IntEnum):
+    """Slots of the engine's cumulative metrics vector"""
+    TOTAL_RENEWABLE_MWH = 0
+    TOTAL_DEMAND_MWH = 1
+    UPTIME_TICKS = 2
+    TOTAL_TICKS = 3
+
+
+_RENEWABLE_MWH, _DEMAND_MWH, _UPTIME_TICKS, _TOTAL_TICKS = Metric
+
+# Source status indexed by "is producing" (False -> STANDBY, True -> ONLINE)
+_STATUS = (EnergySourceStatus.STANDBY, EnergySourceStatus.ONLINE)
+_ONLINE = EnergySourceStatus.ONLINE
+
+# Columns of the summary array returned by run_ensemble (Metrics fields)
+ENSEMBLE_FIELDS = (
+    "renewable_energy_percent",
+    "co2_emissions_kg",
+    "operational_cost_eur",
+    "grid_uptime_percent",
+    "gas_activation_count",
+    "battery_cycles",
+)
 
 
 class SimulationEngine:
     """Main simulation orchestrator"""
+
+    __slots__ = ('time', '_tick_hours', 'weather', 'demand', 'wind', 'solar', 'battery', 'gas',
+                 'controller', '_cm', '_last_state', '_last_json', '_tick_values', '_state_pool',
+                 '_sim_epoch', '_tick_delta')
+
+    # GridStates reused round-robin by tick(); see _pooled_state
+    STATE_POOL_SIZE = 8
     
-    def __init__(self):
+    def __init__(self, seed: Optional[int] = None):
+        """
+        Args:
+            seed: Seed for the weather's random generator, for
+                reproducible runs; None seeds from the OS
+        """
         # Time management
         self.time = TimeManager(tick_duration_minutes=15)
+        self._tick_hours = self.time.tick_hours
         
         # Weather
         self.weather = WeatherSystem(
             initial_wind_speed=8.0,
             initial_cloud_cover=0.3,
-            initial_temperature=12.0
+            initial_temperature=12.0,
+            seed=seed
         )
         
         # Demand
@@ -52,145 +99,553 @@ class SimulationEngine:
         # Grid controller
         self.controller = GridController()
         
-        # Metrics
-        self.cumulative_metrics = {
-            "total_renewable_mwh": 0.0,
-            "total_demand_mwh": 0.0,
-            "uptime_ticks": 0,
-            "total_ticks": 0
-        }
+        # Metrics, indexed by Metric; read as a dict via cumulative_metrics
+        self._cm = np.zeros(len(Metric))
 
         self._last_state = None
+        self._last_json = None  # JSON of _last_state, serialized on first read
+        self._tick_values = None  # Set by _advance, read by snapshot
+        self._state_pool = [None] * self.STATE_POOL_SIZE
+
+        # States are stamped with simulated time: epoch + ticks * tick length
+        self._sim_epoch = datetime.now()
+        self._tick_delta = timedelta(minutes=self.time.tick_duration_minutes)
         
-    def tick(self) -> GridState:
+    def tick(self, build_state: bool = True) -> Optional[GridState]:
         """
         Advance simulation by one tick (15 minutes)
+
+        Args:
+            build_state: Build the GridState for this tick; callers that
+                only need every n-th state can pass False and call
+                snapshot() when they do
         
         Returns:
-            Current grid state
+            Current grid state, or None when build_state is False
         """
+        self._advance()
+        return self.snapshot() if build_state else None
+
+    def _advance(self):
+        """Run one tick of the numeric simulation without building a GridState"""
         # Update weather
         self.weather.update()
         
-        # Calculate power generation
-        wind_power, wind_status = self.wind.calculate_power(self.weather.wind_speed)
-        solar_power, solar_status = self.solar.calculate_power(
-            self.time.time_of_day,
-            self.weather.cloud_cover
-        )
-        
-        # Calculate demand
-        demand_data = self.demand.calculate_demand(
+        # Generation and demand in one compiled call
+        demand = self.demand
+        wind_power, solar_power, residential, industrial, heating_cooling = physics_step(
             self.time.time_of_day,
-            self.weather.temperature
+            self.weather.temperature,
+            self.weather.wind_speed,
+            self.weather.cloud_cover,
+            self.wind.total_capacity_mw,
+            self.solar.capacity_mw,
+            demand.base_load_mw,
+            demand.peak_multiplier,
+            demand.industrial_load_mw if demand.industrial_enabled else 0.0
         )
-        total_demand = demand_data["total_demand"]
+        total_demand = residential + industrial + heating_cooling
         
         # Balance grid
+        tick_hours = self._tick_hours
         balance_result = self.controller.balance_grid(
             demand_mw=total_demand,
             wind_output=wind_power,
             solar_output=solar_power,
             battery=self.battery,
             gas_plant=self.gas,
-            duration_hours=self.time.tick_duration_minutes / 60.0
+            duration_hours=tick_hours
         )
         
         # Update cumulative metrics
-        tick_hours = self.time.tick_duration_minutes / 60.0
         renewable_energy = (wind_power + solar_power) * tick_hours
         total_energy = total_demand * tick_hours
 
-        self.cumulative_metrics["total_renewable_mwh"] += renewable_energy
-        self.cumulative_metrics["total_demand_mwh"] += total_energy
-        self.cumulative_metrics["total_ticks"] += 1
+        cm = self._cm
+        cm[_RENEWABLE_MWH] += renewable_energy
+        cm[_DEMAND_MWH] += total_energy
+        cm[_TOTAL_TICKS] += 1
 
-        if balance_result["grid_stable"]:
-            self.cumulative_metrics["uptime_ticks"] += 1
-        
-        # Build grid state
-        state = GridState(
-            timestamp=datetime.now(),
-            simulation_day=self.time.current_day,
-            weather=WeatherState(
-                wind_speed=self.weather.wind_speed,
-                cloud_cover=self.weather.cloud_cover,
-                temperature=self.weather.temperature,
-                time_of_day=self.time.time_of_day
-            ),
-            demand=DemandState(
-                base_load=demand_data["base_load"],
-                industrial_load=demand_data["industrial_load"],
-                heating_cooling_load=demand_data["heating_cooling_load"]
-            ),
-            wind=WindTurbineState(
-                num_turbines=self.wind.num_turbines,
-                turbine_capacity_mw=self.wind.rated_power_mw,
-                current_output_mw=wind_power,
-                status=EnergySourceStatus.ONLINE if wind_power > 0 else EnergySourceStatus.STANDBY
-            ),
-            solar=SolarArrayState(
-                capacity_mw=self.solar.capacity_mw,
-                current_output_mw=solar_power,
-                status=EnergySourceStatus.ONLINE if solar_power > 0 else EnergySourceStatus.STANDBY
-            ),
-            battery=BatteryState(
-                capacity_mw=self.battery.max_discharge_rate_mw,
-                max_capacity_mwh=self.battery.max_capacity_mwh,
-                current_charge_mwh=self.battery.current_charge_mwh,
-                current_output_mw=balance_result["battery_action"],
-                status=EnergySourceStatus.ONLINE
-            ),
-            gas=GasPlantState(
-                capacity_mw=self.gas.capacity_mw,
-                current_output_mw=self.gas.current_output_mw,
-                status=EnergySourceStatus.ONLINE if self.gas.is_running else EnergySourceStatus.STANDBY
-            ),
-            metrics=Metrics(
-                renewable_energy_percent=self._calculate_renewable_percent(),
-                co2_emissions_kg=self.gas.total_co2_tons * 1000,
-                operational_cost_eur=self.gas.total_fuel_cost_eur,
-                grid_uptime_percent=self._calculate_uptime_percent(),
-                gas_activation_count=self.gas.activation_count,
-                battery_cycles=self.battery.total_cycles,
-            )
-        )
+        if balance_result.grid_stable:
+            cm[_UPTIME_TICKS] += 1
 
-        self._last_state = state
+        # Inputs and outputs of this tick, for snapshot()
+        time = self.time
+        weather = self.weather
+        self._tick_values = (
+            time.total_ticks, time.current_day, time.time_of_day,
+            weather.wind_speed, weather.cloud_cover, weather.temperature,
+            wind_power, solar_power, residential, industrial, heating_cooling,
+            balance_result.battery_action
+        )
+        self._last_state = None
+        self._last_json = None
         
         # Advance time
-        self.time.tick()
-        
-        return state
+        time.tick()
+
+    def snapshot(self) -> GridState:
+        """
+        GridState for the most recent tick, built on first call
+
+        Returns:
+            The same state as tick() would have returned for that tick
+        """
+        if self._last_state is not None:
+            return self._last_state
+        if self._tick_values is None:
+            return self.tick()
+
+        (ticks, day, time_of_day, wind_speed, cloud_cover, temperature, wind_power,
+         solar_power, residential, industrial, heating_cooling, battery_action) = self._tick_values
+        weather = {
+            "wind_speed": wind_speed,
+            "cloud_cover": cloud_cover,
+            "temperature": temperature,
+            "time_of_day": time_of_day
+        }
+        demand_data = {
+            "base_load": residential,
+            "industrial_load": industrial,
+            "heating_cooling_load": heating_cooling,
+            "total_demand": residential + industrial + heating_cooling
+        }
+        self._last_state = self._pooled_state(self._timestamp(ticks), day, weather, demand_data,
+                                              wind_power, solar_power, battery_action)
+        return self._last_state
     
+    def _build_state(self, timestamp, day, weather, demand_data, wind_power,
+                     solar_power, battery_action) -> GridState:
+        """GridState for one tick; storage, gas and metrics come from the subsystems"""
+        # The nested sections are plain dicts so the whole tree is
+        # validated in one pydantic-core call
+        return GridState.model_validate({
+            "timestamp": timestamp,
+            "simulation_day": day,
+            "weather": weather,
+            "demand": {
+                "base_load": demand_data["base_load"],
+                "industrial_load": demand_data["industrial_load"],
+                "heating_cooling_load": demand_data["heating_cooling_load"]
+            },
+            "wind": {
+                "num_turbines": self.wind.num_turbines,
+                "turbine_capacity_mw": self.wind.rated_power_mw,
+                "capacity_mw": self.wind.total_capacity_mw,
+                "current_output_mw": wind_power,
+                "status": _STATUS[wind_power > 0]
+            },
+            "solar": {
+                "capacity_mw": self.solar.capacity_mw,
+                "current_output_mw": solar_power,
+                "status": _STATUS[solar_power > 0]
+            },
+            "battery": {
+                "capacity_mw": self.battery.max_discharge_rate_mw,
+                "max_capacity_mwh": self.battery.max_capacity_mwh,
+                "current_charge_mwh": self.battery.current_charge_mwh,
+                "current_output_mw": battery_action,
+                "status": _ONLINE
+            },
+            "gas": {
+                "capacity_mw": self.gas.capacity_mw,
+                "current_output_mw": self.gas.current_output_mw,
+                "status": _STATUS[self.gas.is_running]
+            },
+            "metrics": {
+                "renewable_energy_percent": self._calculate_renewable_percent(),
+                "co2_emissions_kg": self.gas.total_co2_tons * 1000,
+                "operational_cost_eur": self.gas.total_fuel_cost_eur,
+                "grid_uptime_percent": self._calculate_uptime_percent(),
+                "gas_activation_count": self.gas.activation_count,
+                "battery_cycles": self.battery.total_cycles,
+            }
+        })
+
+    def _pooled_state(self, timestamp, day, weather, demand_data, wind_power,
+                      solar_power, battery_action) -> GridState:
+        """
+        GridState for one tick, reusing a pooled instance
+
+        A pool slot is validated once, on first use. Later ticks write
+        the same values straight into the model dicts, skipping both
+        validation and pydantic's per-attribute __setattr__. Every value
+        is cast to its field type, as validation would.
+
+        A state is overwritten STATE_POOL_SIZE ticks later. Callers that
+        keep one longer should take model_copy(deep=True).
+        """
+        slot = self.time.total_ticks % self.STATE_POOL_SIZE
+        state = self._state_pool[slot]
+        if state is None:
+            state = self._state_pool[slot] = self._build_state(
+                timestamp, day, weather, demand_data, wind_power, solar_power, battery_action
+            )
+            return state
+
+        state.__dict__.update(timestamp=timestamp, simulation_day=int(day))
+        state.__dict__.pop("_totals", None)  # cached for the previous tick
+        state.weather.__dict__.update(
+            wind_speed=float(weather["wind_speed"]),
+            cloud_cover=float(weather["cloud_cover"]),
+            temperature=float(weather["temperature"]),
+            time_of_day=float(weather["time_of_day"])
+        )
+        state.demand.__dict__.update(
+            base_load=float(demand_data["base_load"]),
+            industrial_load=float(demand_data["industrial_load"]),
+            heating_cooling_load=float(demand_data["heating_cooling_load"])
+        )
+        state.wind.__dict__.update(
+            num_turbines=int(self.wind.num_turbines),
+            turbine_capacity_mw=float(self.wind.rated_power_mw),
+            capacity_mw=float(self.wind.total_capacity_mw),
+            current_output_mw=float(wind_power),
+            status=_STATUS[wind_power > 0]
+        )
+        state.solar.__dict__.update(
+            capacity_mw=float(self.solar.capacity_mw),
+            current_output_mw=float(solar_power),
+            status=_STATUS[solar_power > 0]
+        )
+        state.battery.__dict__.update(
+            capacity_mw=float(self.battery.max_discharge_rate_mw),
+            max_capacity_mwh=float(self.battery.max_capacity_mwh),
+            current_charge_mwh=float(self.battery.current_charge_mwh),
+            current_output_mw=float(battery_action)
+        )
+        state.gas.__dict__.update(
+            capacity_mw=float(self.gas.capacity_mw),
+            current_output_mw=float(self.gas.current_output_mw),
+            status=_STATUS[self.gas.is_running]
+        )
+        state.metrics.__dict__.update(
+            renewable_energy_percent=float(self._calculate_renewable_percent()),
+            co2_emissions_kg=float(self.gas.total_co2_tons * 1000),
+            operational_cost_eur=float(self.gas.total_fuel_cost_eur),
+            grid_uptime_percent=float(self._calculate_uptime_percent()),
+            gas_activation_count=int(self.gas.activation_count),
+            battery_cycles=float(self.battery.total_cycles)
+        )
+        return state
+
+    def _timestamp(self, ticks: int) -> datetime:
+        """Simulated wall-clock time after the given number of ticks"""
+        return self._sim_epoch + self._tick_delta * ticks
+
     def get_current_state(self):
         """Return the last computed state without advancing the simulation"""
-        if self._last_state is None:
-            return self.tick()
-        return self._last_state
+        return self.snapshot()
+
+    def get_current_state_json(self) -> bytes:
+        """Return the last state as JSON bytes, serialized at most once per tick"""
+        state = self.get_current_state()
+        if self._last_json is None:
+            self._last_json = GridState.__pydantic_serializer__.to_json(state, by_alias=False)
+        return self._last_json
+
+    def simulate_timeseries(self, hours, temps, winds, clouds) -> np.ndarray:
+        """
+        Run many ticks through the compiled kernel
+
+        Weather and time of day come from the caller instead of the
+        weather system and clock. Battery, gas and cumulative metrics
+        continue from the current state and are updated in place, and
+        the current state reflects them from then on.
+
+        Args:
+            hours: Time of day for each tick (0-24)
+            temps: Temperature for each tick in Celsius
+            winds: Wind speed for each tick in m/s
+            clouds: Cloud cover for each tick (0.0-1.0)
+
+        Returns:
+            Record array of per-tick results (TIMESERIES_DTYPE)
+        """
+        hours = np.ascontiguousarray(hours, dtype=BATCH_DTYPE)
+        temps = np.ascontiguousarray(temps, dtype=BATCH_DTYPE)
+        winds = np.ascontiguousarray(winds, dtype=BATCH_DTYPE)
+        clouds = np.ascontiguousarray(clouds, dtype=BATCH_DTYPE)
+        n = len(hours)
+        tick_hours = self._tick_hours
+        params = self._kernel_params()
+        state = self._kernel_state()
+
+        out = np.empty(n, dtype=TIMESERIES_DTYPE)
+        self._set_kernel_state(simulate_timeseries(
+            n, hours, temps, winds, clouds, params, state, out
+        ))
+
+        # Same accumulation as tick(), summed in float64
+        renewable = np.add(out["wind_output"], out["solar_output"], dtype=np.float64)
+        self._cm += (
+            renewable.sum() * tick_hours,
+            out["total_demand"].sum(dtype=np.float64) * tick_hours,
+            out["grid_stable"].sum(),
+            n,
+        )
+
+        # Battery, gas and metrics moved on; rebuild the state on next read
+        self._last_state = None
+        self._last_json = None
+
+        return out
+
+    def run_batch(self, n_ticks: int, sample_every: int = 4) -> list:
+        """
+        Advance the simulation n_ticks through the compiled kernel
+
+        Weather is sampled for the whole run up front and time of day
+        comes from the clock, so this continues exactly where tick()
+        would. GridState is only built for every sample_every-th tick
+        and for the final one.
+
+        Args:
+            n_ticks: Number of ticks to simulate
+            sample_every: Interval, in ticks, between returned states
+
+        Returns:
+            List of GridState, the last being the current state; empty
+            when n_ticks is 0
+        """
+        if n_ticks < 0:
+            raise ValueError(f"n_ticks must be >= 0, got {n_ticks}")
+        if sample_every < 1:
+            raise ValueError(f"sample_every must be >= 1, got {sample_every}")
+        if n_ticks == 0:
+            return []
+
+        tick_hours = self._tick_hours
+        winds, clouds, temps = self.weather.update_many(n_ticks).T
+        hours, days = self.time.upcoming(n_ticks)
+        # Full precision throughout: the sampled states are built from
+        # these records and must balance exactly as tick()'s do
+        inputs = [np.ascontiguousarray(a, dtype=np.float64) for a in (hours, temps, winds, clouds)]
+        params = self._kernel_params()
+        state = self._kernel_state()
+        out = np.empty(n_ticks, dtype=STATE_TIMESERIES_DTYPE)
+
+        # Run up to each sampled tick, keeping the kernel state there
+        sampled = list(range(sample_every - 1, n_ticks, sample_every))
+        if not sampled or sampled[-1] != n_ticks - 1:
+            sampled.append(n_ticks - 1)
+        sampled_states = []
+        start = 0
+        for i in sampled:
+            stop = i + 1
+            state = simulate_timeseries(
+                stop - start, *[a[start:stop] for a in inputs], params, state, out[start:stop]
+            )
+            sampled_states.append(state)
+            start = stop
+
+        # Running totals at every tick, as tick() would accumulate them
+        cm = np.empty((n_ticks, len(Metric)))
+        cm[:, _RENEWABLE_MWH] = np.cumsum(out["wind_output"] + out["solar_output"]) * tick_hours
+        cm[:, _DEMAND_MWH] = np.cumsum(out["total_demand"]) * tick_hours
+        cm[:, _UPTIME_TICKS] = np.cumsum(out["grid_stable"])
+        cm[:, _TOTAL_TICKS] = np.arange(1, n_ticks + 1)
+        cm += self._cm
+        total_ticks = self.time.total_ticks
+
+        demand = self.demand
+        industrial_mw = demand.industrial_load_mw if demand.industrial_enabled else 0.0
+        states = []
+        for i, state in zip(sampled, sampled_states):
+            self._set_kernel_state(state)
+            self._cm = cm[i].copy()
+
+            # Same compiled call as _advance, so the demand breakdown is
+            # the one tick() would report
+            hour = float(hours[i])
+            temp, wind_speed, cloud = float(temps[i]), float(winds[i]), float(clouds[i])
+            wind_power, solar_power, residential, industrial, heating_cooling = physics_step(
+                hour, temp, wind_speed, cloud, self.wind.total_capacity_mw,
+                self.solar.capacity_mw, demand.base_load_mw, demand.peak_multiplier, industrial_mw
+            )
+            weather = {
+                "wind_speed": wind_speed,
+                "cloud_cover": cloud,
+                "temperature": temp,
+                "time_of_day": hour
+            }
+            demand_data = {
+                "base_load": residential,
+                "industrial_load": industrial,
+                "heating_cooling_load": heating_cooling
+            }
+            states.append(self._build_state(
+                self._timestamp(total_ticks + i), int(days[i]), weather, demand_data,
+                wind_power, solar_power, float(out["battery_action"][i])
+            ))
+
+        self._last_state = states[-1]
+        self._last_json = None
+        self.time.advance(n_ticks)
+
+        return states
+
+    def sweep_scenarios(self, hours, temps, winds, clouds, params=None):
+        """
+        Run independent scenarios in parallel through the compiled kernel
+
+        Every scenario starts from the engine's current battery and gas
+        state. The engine itself is not modified.
+
+        Args:
+            hours: Time of day per tick, shape (T,) or (N, T)
+            temps: Temperature per tick, shape (T,) or (N, T)
+            winds: Wind speed per tick, shape (T,) or (N, T)
+            clouds: Cloud cover per tick, shape (T,) or (N, T)
+            params: Optional (N, len(PARAM_FIELDS)) array of per-scenario
+                parameters; defaults to the engine's own for every scenario
+
+        Returns:
+            (results shaped (N, T, len(SWEEP_FIELDS)),
+             final states shaped (N, len(STATE_FIELDS)))
+        """
+        inputs = [np.asarray(a, dtype=BATCH_DTYPE) for a in (hours, temps, winds, clouds)]
+        if params is None:
+            n = max((a.shape[0] for a in inputs if a.ndim == 2), default=1)
+            params = np.tile(self._kernel_params(), (n, 1))
+        params = np.ascontiguousarray(params, dtype=np.float64)
+        n, n_ticks = len(params), inputs[0].shape[-1]
+        inputs = [np.ascontiguousarray(np.broadcast_to(a, (n, n_ticks))) for a in inputs]
+
+        states = np.tile(np.array(self._kernel_state(), dtype=np.float64), (n, 1))
+        out = np.empty((n, n_ticks, len(SWEEP_FIELDS)), dtype=BATCH_DTYPE)
+
+        sweep(*inputs, params, states, out)
+        return out, states
+
+    def _kernel_params(self) -> tuple:
+        """Subsystem parameters in kernels.PARAM_FIELDS order"""
+        return (
+            float(self.wind.total_capacity_mw),
+            float(self.solar.capacity_mw),
+            float(self.demand.base_load_mw),
+            float(self.demand.peak_multiplier),
+            float(self.demand.industrial_load_mw if self.demand.industrial_enabled else 0.0),
+            float(self.battery.max_capacity_mwh),
+            float(self.battery.max_charge_rate_mw),
+            float(self.battery.max_discharge_rate_mw),
+            float(self.battery.round_trip_efficiency),
+            float(self.gas.capacity_mw),
+            float(self.gas.ramp_rate_mw_per_min),
+            float(self.gas.fuel_cost_per_mwh),
+            float(self.gas.co2_per_mwh_tons),
+            self._tick_hours,
+        )
+
+    def _kernel_state(self) -> tuple:
+        """Battery and gas state in kernels.STATE_FIELDS order"""
+        return (
+            float(self.battery.current_charge_mwh),
+            float(self.battery.total_cycles),
+            float(self.gas.current_output_mw),
+            float(self.gas.total_runtime_hours),
+            float(self.gas.total_fuel_cost_eur),
+            float(self.gas.total_co2_tons),
+            int(self.gas.activation_count),
+        )
+
+    def _set_kernel_state(self, state):
+        """Write a kernels.STATE_FIELDS tuple back to the battery and gas plant"""
+        (self.battery.current_charge_mwh, self.battery.total_cycles,
+         self.gas.current_output_mw, self.gas.total_runtime_hours,
+         self.gas.total_fuel_cost_eur, self.gas.total_co2_tons,
+         self.gas.activation_count) = state
+
+    @property
+    def cumulative_metrics(self) -> dict:
+        """Running totals by name; a fresh dict built from the metrics vector"""
+        renewable, demand, uptime, ticks = self._cm.tolist()
+        return {
+            "total_renewable_mwh": renewable,
+            "total_demand_mwh": demand,
+            "uptime_ticks": int(uptime),
+            "total_ticks": int(ticks)
+        }
 
     def _calculate_renewable_percent(self) -> float:
         """Calculate overall renewable percentage"""
-        if self.cumulative_metrics["total_demand_mwh"] == 0:
+        cm = self._cm
+        if cm[_DEMAND_MWH] == 0:
             return 0.0
-        return (self.cumulative_metrics["total_renewable_mwh"] / 
-                self.cumulative_metrics["total_demand_mwh"]) * 100
+        return (cm[_RENEWABLE_MWH] / cm[_DEMAND_MWH]) * 100
     
     def _calculate_uptime_percent(self) -> float:
         """Calculate grid uptime percentage"""
-        if self.cumulative_metrics["total_ticks"] == 0:
+        cm = self._cm
+        if cm[_TOTAL_TICKS] == 0:
             return 100.0
-        return (self.cumulative_metrics["uptime_ticks"] / 
-                self.cumulative_metrics["total_ticks"]) * 100
+        return (cm[_UPTIME_TICKS] / cm[_TOTAL_TICKS]) * 100
     
     def reset(self):
         """Reset simulation to start"""
         self.time.reset()
-        self.weather = WeatherSystem()
-        self.battery = Battery(max_capacity_mwh=400.0, initial_charge_mwh=200.0)
-        self.gas = GasPlant(capacity_mw=300.0)
-        self.cumulative_metrics = {k: 0.0 for k in self.cumulative_metrics}
+        self.weather.reset()
+        self.battery.reset(initial_charge_mwh=200.0)
+        self.gas.reset()
+        self._cm.fill(0.0)
         self._last_state = None
+        self._last_json = None
+        self._tick_values = None
+        self._sim_epoch = datetime.now()
+
+
+def _run_one(args) -> np.ndarray:
+    """Run one seeded replica for run_ensemble; returns its ENSEMBLE_FIELDS row"""
+    seed, n_ticks = args
+    sim = SimulationEngine(seed=seed)
+    if n_ticks > 0:
+        # Only the final state is needed, so build just that one
+        sim.run_batch(n_ticks, sample_every=n_ticks)
+
+    # Read from the subsystems, as _build_state fills Metrics
+    return np.array([
+        sim._calculate_renewable_percent(),
+        sim.gas.total_co2_tons * 1000,
+        sim.gas.total_fuel_cost_eur,
+        sim._calculate_uptime_percent(),
+        sim.gas.activation_count,
+        sim.battery.total_cycles,
+    ], dtype=np.float64)
+
+
+def run_ensemble(n_replicas: int, n_ticks: int, seeds: Optional[Iterable[int]] = None,
+                 max_workers: Optional[int] = None) -> np.ndarray:
+    """
+    Run independent Monte Carlo replicas of the simulation across processes
+
+    Each replica is a fresh SimulationEngine whose weather is seeded from
+    seeds, so equal seeds give equal rows.
+
+    Args:
+        n_replicas: Number of replicas to run
+        n_ticks: Ticks per replica; 0 gives each replica's starting metrics
+        seeds: One seed per replica; defaults to 0..n_replicas-1
+        max_workers: Worker processes; defaults to os.cpu_count()
+
+    Returns:
+        Array shaped (n_replicas, len(ENSEMBLE_FIELDS)) of final metrics
+    """
+    if n_ticks < 0:
+        raise ValueError(f"n_ticks must be >= 0, got {n_ticks}")
+    seeds = list(range(n_replicas)) if seeds is None else list(seeds)
+    if len(seeds) != n_replicas:
+        raise ValueError(f"Expected {n_replicas} seeds, got {len(seeds)}")
+    if n_replicas == 0:
+        return np.zeros((0, len(ENSEMBLE_FIELDS)))
+    if n_ticks == 0:
+        # Nothing to simulate; not worth starting workers
+        return np.array([_run_one((seed, 0)) for seed in seeds])
+
+    # Spawned workers start clean instead of forking the parent's numba
+    # threading layer
+    with ProcessPoolExecutor(max_workers=max_workers or os.cpu_count(),
+                             mp_context=multiprocessing.get_context("spawn")) as ex:
+        return np.array(list(ex.map(_run_one, [(seed, n_ticks) for seed in seeds])))
 
 
 # Test
@@ -202,9 +657,10 @@ if __name__ == "__main__":
     print("-" * 75)
     
     for i in range(96):  # 96 ticks = 24 hours at 15min intervals
-        state = sim.tick()
+        # Only the hourly rows are printed; skip building the rest
+        state = sim.tick(build_state=(i % 4 == 0))
         
-        if i % 4 == 0:  # Print every hour
+        if state is not None:  # Print every hour
             print(f"{state.weather.time_of_day:05.2f} | "
                   f"{state.wind.current_output_mw:5.0f} | "
                   f"{state.solar.current_output_mw:5.0f} | "
@@ -213,6 +669,7 @@ if __name__ == "__main__":
                   f"{state.gas.current_output_mw:5.0f} | "
                   f"{state.metrics.renewable_energy_percent:5.1f}%")
     
+    state = sim.snapshot()
     print(f"\n24-Hour Summary:")
     print(f"  Total CO2: {state.metrics.co2_emissions_kg:.1f} kg")
     print(f"  Total Cost: €{state.metrics.operational_cost_eur:.2f}")
@@ -4,12 +4,23 @@ Time Manager - Handles simulation time advancement
 The simulation runs in 15-minute ticks, advancing through 24-hour cycles.
 """
 
+import math
 from datetime import datetime, timedelta
 from typing import Optional
 
+import numpy as np
+
+from app.utils.fast_math import PI_OVER_12
+
+
+MINUTES_PER_DAY = 24 * 60
+
 
 class TimeManager:
     """Manages simulation time advancement"""
+
+    __slots__ = ('tick_duration_minutes', 'tick_hours', 'current_hour', 'current_day',
+                 '_tick_index', '_minute_of_day', '_solar_lut')
     
     def __init__(self, tick_duration_minutes: int = 15, start_hour: float = 0.0):
         """
@@ -18,21 +29,62 @@ class TimeManager:
             start_hour: Starting hour of day (0.0 = midnight, 12.0 = noon)
         """
         self.tick_duration_minutes = tick_duration_minutes
+        self.tick_hours = tick_duration_minutes / 60.0
+
+        # Time is counted in whole ticks and minutes; current_hour and
+        # current_day are derived from the counters on every change, so
+        # long runs do not accumulate rounding error
+        self._tick_index = 0
+        self._minute_of_day = start_hour * 60.0
         self.current_hour = start_hour
         self.current_day = 1
-        self.total_ticks = 0
+
+        # Solar elevation at each tick of the day, for the fixed schedule
+        hours = np.arange(0.0, 24.0, self.tick_hours)
+        self._solar_lut = np.where(
+            (hours >= 6.0) & (hours < 18.0),
+            np.sin((hours - 6.0) * PI_OVER_12),
+            0.0
+        ).tolist()
         
     def tick(self):
         """Advance time by one tick"""
-        hours_per_tick = self.tick_duration_minutes / 60.0
-        self.current_hour += hours_per_tick
+        self._tick_index += 1
+        minute = self._minute_of_day + self.tick_duration_minutes
         
         # Roll over to next day at 24:00
-        if self.current_hour >= 24.0:
-            self.current_hour -= 24.0
+        if minute >= MINUTES_PER_DAY:
+            minute -= MINUTES_PER_DAY
             self.current_day += 1
-            
-        self.total_ticks += 1
+
+        self._minute_of_day = minute
+        self.current_hour = minute / 60.0
+
+    def advance(self, n_ticks: int):
+        """Advance time by n_ticks at once"""
+        self._tick_index += n_ticks
+        days, minute = divmod(self._minute_of_day + n_ticks * self.tick_duration_minutes,
+                              MINUTES_PER_DAY)
+        self.current_day += int(days)
+        self._minute_of_day = minute
+        self.current_hour = minute / 60.0
+
+    def upcoming(self, n_ticks: int):
+        """
+        Hour of day and day number at each of the next n_ticks ticks
+
+        Returns:
+            (hours, days) arrays; entry 0 is the current time, matching
+            what current_hour and current_day read on each tick()
+        """
+        minutes = self._minute_of_day + np.arange(n_ticks) * self.tick_duration_minutes
+        days, minute_of_day = np.divmod(minutes, MINUTES_PER_DAY)
+        return minute_of_day / 60.0, self.current_day + days.astype(int)
+
+    @property
+    def total_ticks(self) -> int:
+        """Ticks elapsed since start"""
+        return self._tick_index
         
     @property
     def time_of_day(self) -> float:
@@ -55,21 +107,23 @@ class TimeManager:
         Solar elevation as 0-1 factor (0 = night, 1 = solar noon)
         Simple sine curve peaking at noon
         """
+        i, rem = divmod(self._minute_of_day, self.tick_duration_minutes)
+        if rem == 0 and i < len(self._solar_lut):
+            return self._solar_lut[int(i)]
+
+        # Off the tick grid (e.g. an unaligned start_hour)
         if self.is_nighttime:
             return 0.0
         
         # Map 6am-6pm to 0-180 degrees
-        hours_since_sunrise = self.current_hour - 6.0
-        angle_radians = (hours_since_sunrise / 12.0) * 3.14159
-        
-        import math
-        return math.sin(angle_radians)
+        return math.sin((self.current_hour - 6.0) * PI_OVER_12)
     
     def reset(self):
         """Reset to start"""
+        self._tick_index = 0
+        self._minute_of_day = 0
         self.current_hour = 0.0
         self.current_day = 1
-        self.total_ticks = 0
 
 
 # Test it
@@ -4,46 +4,94 @@ Weather System
 Simulates wind speed and cloud cover with realistic variations.
 """
 
-import random
+from typing import Optional
+
+import numpy as np
+
+from app.simulation.weather_kernels import DRAWS_PER_TICK, advance_weather
+
+
+# Ticks of random draws generated per refill of the update() buffer
+RNG_BUFFER_TICKS = 4096
 
 
 class WeatherSystem:
     """Dynamic weather simulator"""
+
+    __slots__ = ('wind_speed', 'cloud_cover', 'temperature', '_rng', '_draws')
     
     def __init__(
         self,
         initial_wind_speed: float = 8.0,
         initial_cloud_cover: float = 0.3,
-        initial_temperature: float = 12.0
+        initial_temperature: float = 12.0,
+        seed: Optional[int] = None
     ):
         """
         Args:
             initial_wind_speed: Starting wind in m/s
             initial_cloud_cover: Starting clouds (0.0-1.0)
             initial_temperature: Starting temp in °C
+            seed: Seed for this instance's random generator; equal seeds
+                give equal weather. None seeds from the OS
         """
         self.wind_speed = initial_wind_speed
         self.cloud_cover = initial_cloud_cover
         self.temperature = initial_temperature
+
+        # All randomness comes from this generator, never global state.
+        # update() consumes uniform [0, 1) draws, DRAWS_PER_TICK per row
+        self._rng = np.random.default_rng(seed)
+        self._draws = iter(())
         
     def update(self):
         """Update weather conditions (call each tick)"""
+        u = next(self._draws, None)
+        if u is None:
+            self._draws = iter(self._rng.random((RNG_BUFFER_TICKS, DRAWS_PER_TICK)).tolist())
+            u = next(self._draws)
+
         # Wind: random walk with drift back to mean
         mean_wind = 8.0
         drift = (mean_wind - self.wind_speed) * 0.05
-        change = random.uniform(-0.8, 0.8) + drift
-        self.wind_speed = max(0, min(30, self.wind_speed + change))
+        change = (u[0] * 1.6 - 0.8) + drift  # uniform(-0.8, 0.8)
+
+        # Reflect at 0 and 30 m/s, as weather_kernels.reflect does. Bound
+        # with comparisons; builtin min/max calls cost several times more
+        # than the arithmetic here
+        wind = self.wind_speed + change
+        self.wind_speed = -wind if wind < 0.0 else (60.0 - wind if wind > 30.0 else wind)
         
         # Clouds: slower changes
-        if random.random() < 0.15:  # 15% chance to change
-            change = random.uniform(-0.15, 0.15)
-            self.cloud_cover = max(0, min(1, self.cloud_cover + change))
+        if u[1] < 0.15:  # 15% chance to change
+            change = u[1] / 0.15 * 0.3 - 0.15  # uniform(-0.15, 0.15)
+            cloud = self.cloud_cover + change
+            self.cloud_cover = 0.0 if cloud < 0.0 else (1.0 if cloud > 1.0 else cloud)
         
         # Temperature: very slow drift
-        if random.random() < 0.05:
-            change = random.uniform(-0.5, 0.5)
-            self.temperature = max(-10, min(35, self.temperature + change))
+        if u[2] < 0.05:
+            change = u[2] / 0.05 - 0.5  # uniform(-0.5, 0.5)
+            temp = self.temperature + change
+            self.temperature = -10.0 if temp < -10.0 else (35.0 if temp > 35.0 else temp)
     
+    def update_many(self, n: int) -> np.ndarray:
+        """
+        Advance the weather n ticks in one compiled call
+
+        Same random walk as update(), driven by numpy draws.
+
+        Returns:
+            (n, 3) array of the conditions after each tick, columns in
+            weather_kernels.WEATHER_FIELDS order
+        """
+        out = np.empty((n, 3))
+        if n > 0:
+            advance_weather(out, self._rng.random((n, DRAWS_PER_TICK)),
+                            float(self.wind_speed), float(self.cloud_cover),
+                            float(self.temperature))
+            self.wind_speed, self.cloud_cover, self.temperature = out[-1].tolist()
+        return out
+
     def set_wind(self, speed: float):
         """Manually set wind speed"""
         self.wind_speed = max(0, min(30, speed))
@@ -58,13 +106,24 @@ class WeatherSystem:
     
     def trigger_storm(self):
         """Simulate storm conditions"""
-        self.wind_speed = random.uniform(20, 28)
-        self.cloud_cover = random.uniform(0.8, 1.0)
+        self.wind_speed = float(self._rng.uniform(20, 28))
+        self.cloud_cover = float(self._rng.uniform(0.8, 1.0))
         
     def trigger_calm(self):
         """Simulate calm weather"""
-        self.wind_speed = random.uniform(0, 2)
-        self.cloud_cover = random.uniform(0, 0.3)
+        self.wind_speed = float(self._rng.uniform(0, 2))
+        self.cloud_cover = float(self._rng.uniform(0, 0.3))
+
+    def reset(
+        self,
+        wind_speed: float = 8.0,
+        cloud_cover: float = 0.3,
+        temperature: float = 12.0
+    ):
+        """Restore starting conditions; the random generator carries on"""
+        self.wind_speed = wind_speed
+        self.cloud_cover = cloud_cover
+        self.temperature = temperature
 
 
 # Test
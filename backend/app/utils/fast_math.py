@@ -0,0 +1,55 @@
+"""
+Fast Math Helpers
+
+Table-driven approximations for the trig in the simulation's hot paths.
+"""
+
+import math
+
+import numpy as np
+from numba import njit
+
+
+# First-quadrant sine table: 256 segments over [0, π/2], plus the endpoint
+_SIN_Q_SIZE = 256
+_SIN_Q = np.sin(np.linspace(0.0, math.pi / 2, _SIN_Q_SIZE + 1))
+_HALF_PI = math.pi / 2
+
+# Angle per hour for the 24h sine curves (12 hours span π)
+PI_OVER_12 = math.pi / 12.0
+_SIN_Q_SCALE = _SIN_Q_SIZE / _HALF_PI
+
+
+@njit(cache=True)
+def fast_sin_0_pi(x: float) -> float:
+    """
+    Sine on [0, π] from a quarter-wave lookup table
+
+    Linear interpolation between table entries keeps the error below
+    1e-5, far under the noise of the weather and demand models.
+
+    Args:
+        x: Angle in radians
+
+    Returns:
+        sin(x) for 0 <= x <= π; 0.0 outside that interval, which is
+        what callers that clip negative sine values to zero want
+    """
+    if x <= 0.0 or x >= math.pi:
+        return 0.0
+
+    # Mirror the second quadrant onto the first: sin(π - x) = sin(x)
+    if x > _HALF_PI:
+        x = math.pi - x
+
+    pos = x * _SIN_Q_SCALE
+    i = int(pos)
+    if i >= _SIN_Q_SIZE:
+        return 1.0
+    frac = pos - i
+    return _SIN_Q[i] + (_SIN_Q[i + 1] - _SIN_Q[i]) * frac
+
+
+# Daily profiles are tabulated at the engine's 15-minute tick resolution
+PROFILE_BUCKETS_PER_HOUR = 4
+PROFILE_SIZE = 24 * PROFILE_BUCKETS_PER_HOUR
@@ -0,0 +1,109 @@
+"""Tests for GridController.balance_grid_batch against per-tick balance_grid"""
+
+import numpy as np
+import pytest
+
+from app.simulation.grid_controller import GridController
+from app.simulation.energy_sources.battery import Battery
+from app.simulation.energy_sources.gas_plant import GasPlant
+
+
+BATTERY_FIELDS = ("current_charge_mwh", "total_cycles")
+GAS_FIELDS = (
+    "current_output_mw", "total_runtime_hours", "total_fuel_cost_eur",
+    "total_co2_tons", "activation_count",
+)
+
+
+def make_grid(charge_mwh, gas_output_mw):
+    battery = Battery(max_capacity_mwh=400.0, initial_charge_mwh=charge_mwh)
+    gas = GasPlant(capacity_mw=300.0)
+    gas.current_output_mw = gas_output_mw
+    return GridController(), battery, gas
+
+
+def assert_batch_matches_ticks(demand, wind, solar, dt=0.25, charge_mwh=200.0, gas_output_mw=0.0):
+    """balance_grid_batch must leave the same per-tick results and state as balance_grid"""
+    n = len(demand)
+    dts = np.broadcast_to(np.asarray(dt, dtype=float), (n,))
+
+    controller, battery, gas = make_grid(charge_mwh, gas_output_mw)
+    expected = [
+        controller.balance_grid(demand[i], wind[i], solar[i], battery, gas, dts[i])
+        for i in range(n)
+    ]
+
+    batch_controller, batch_battery, batch_gas = make_grid(charge_mwh, gas_output_mw)
+    result = batch_controller.balance_grid_batch(demand, wind, solar, batch_battery, batch_gas, dt)
+
+    np.testing.assert_array_equal(result.battery_action, [r.battery_action for r in expected])
+    np.testing.assert_array_equal(result.gas_output, [r.gas_output for r in expected])
+    np.testing.assert_array_equal(result.grid_stable, [r.grid_stable for r in expected])
+    for name in BATTERY_FIELDS:
+        assert getattr(batch_battery, name) == getattr(battery, name), name
+    for name in GAS_FIELDS:
+        assert getattr(batch_gas, name) == getattr(gas, name), name
+    assert batch_controller.gas_active == controller.gas_active
+
+
+def constant(n, value):
+    return np.full(n, float(value))
+
+
+def test_surplus_run_until_battery_is_full():
+    n = 200
+    assert_batch_matches_ticks(constant(n, 300), constant(n, 280), constant(n, 40), charge_mwh=100.0)
+
+
+def test_full_battery_then_deficit():
+    n = 120
+    wind = np.concatenate((constant(80, 380), constant(40, 250)))
+    assert_batch_matches_ticks(constant(n, 300), wind, constant(n, 0), charge_mwh=400.0)
+
+
+def test_battery_running_dry_hands_over_to_gas():
+    n = 100
+    assert_batch_matches_ticks(constant(n, 300), constant(n, 290), constant(n, 0), charge_mwh=100.0)
+
+
+def test_gas_already_on():
+    # Surplus leaves a running plant alone; small deficits ramp it down
+    n = 80
+    wind = np.concatenate((constant(40, 310), constant(40, 295)))
+    assert_batch_matches_ticks(
+        constant(n, 300), wind, constant(n, 0), charge_mwh=300.0, gas_output_mw=250.0
+    )
+
+
+def test_zero_duration_ticks():
+    n = 120
+    rng = np.random.default_rng(3)
+    dt = np.where(rng.random(n) < 0.2, 0.0, 0.25)
+    wind = np.concatenate((constant(60, 330), constant(60, 280)))
+    assert_batch_matches_ticks(constant(n, 300), wind, constant(n, 0), dt=dt)
+
+
+def test_all_zero_duration():
+    n = 40
+    assert_batch_matches_ticks(constant(n, 300), constant(n, 320), constant(n, 0), dt=0.0)
+
+
+@pytest.mark.parametrize("seed", range(40))
+def test_random_traces(seed):
+    """Piecewise regimes of surplus, small and large deficits with noise"""
+    rng = np.random.default_rng(seed)
+    segments = []
+    while sum(len(s) for s in segments) < 400:
+        length = int(rng.integers(1, 80))
+        level = rng.choice([-150.0, -40.0, -5.0, 0.0, 5.0, 30.0, 120.0])
+        segments.append(level + rng.normal(0.0, 3.0, length))
+    balance = np.concatenate(segments)[:400]
+    demand = 300.0 + rng.normal(0.0, 5.0, 400)
+    solar = np.clip(rng.normal(40.0, 10.0, 400), 0.0, None)
+    wind = np.clip(demand + balance - solar, 0.0, None)
+    dt = np.where(rng.random(400) < 0.05, 0.0, 0.25)
+    assert_batch_matches_ticks(
+        demand, wind, solar, dt=dt,
+        charge_mwh=float(rng.uniform(0.0, 400.0)),
+        gas_output_mw=float(rng.choice([0.0, 80.0]))
+    )
@@ -0,0 +1,127 @@
+"""Tests for SimulationEngine's batch and pooled-state paths"""
+
+import json
+
+import numpy as np
+import pytest
+
+from app.simulation.simulation_engine import ENSEMBLE_FIELDS, SimulationEngine, run_ensemble
+
+
+SEED = 7
+N_TICKS = 2000
+
+
+@pytest.fixture(scope="module")
+def ticked_states():
+    """States from tick() for the seeded trajectory, copied out of the pool"""
+    sim = SimulationEngine(seed=SEED)
+    return [sim.tick().model_copy(deep=True) for _ in range(N_TICKS)]
+
+
+@pytest.mark.parametrize("sample_every", [1, 4, 96])
+def test_run_batch_states_match_tick(ticked_states, sample_every):
+    sim = SimulationEngine(seed=SEED)
+    states = sim.run_batch(N_TICKS, sample_every=sample_every)
+
+    sampled = list(range(sample_every - 1, N_TICKS, sample_every))
+    if sampled[-1] != N_TICKS - 1:
+        sampled.append(N_TICKS - 1)
+    assert len(states) == len(sampled)
+
+    for i, state in zip(sampled, states):
+        expected = ticked_states[i]
+        assert state.is_grid_stable == expected.is_grid_stable, f"tick {i}"
+        assert state.supply_demand_balance == expected.supply_demand_balance, f"tick {i}"
+        assert state.timestamp == sim._timestamp(i)
+        assert state.model_dump(exclude={"timestamp"}) == expected.model_dump(exclude={"timestamp"}), \
+            f"tick {i}"
+
+
+def test_run_batch_continues_like_tick():
+    a = SimulationEngine(seed=SEED)
+    b = SimulationEngine(seed=SEED)
+    a.run_batch(500)
+    for _ in range(500):
+        b.tick(build_state=False)
+
+    assert a.cumulative_metrics == b.cumulative_metrics
+    assert a.tick().model_dump(exclude={"timestamp"}) == b.tick().model_dump(exclude={"timestamp"})
+
+
+def test_run_ensemble_without_ticks_gives_starting_metrics():
+    metrics = run_ensemble(3, 0)
+
+    assert metrics.shape == (3, len(ENSEMBLE_FIELDS))
+    uptime = ENSEMBLE_FIELDS.index("grid_uptime_percent")
+    assert (metrics[:, uptime] == 100.0).all()
+    assert (np.delete(metrics, uptime, axis=1) == 0.0).all()
+
+
+def test_run_ensemble_rejects_negative_ticks():
+    with pytest.raises(ValueError):
+        run_ensemble(2, -1)
+
+
+def fresh_state_engine(seed, epoch):
+    """Engine whose states are always built by validation, never pooled"""
+    sim = SimulationEngine(seed=seed)
+    sim._sim_epoch = epoch
+    return sim
+
+
+def test_pooled_state_matches_fresh_state_after_slot_reuse():
+    pooled = SimulationEngine(seed=SEED)
+    fresh = fresh_state_engine(SEED, pooled._sim_epoch)
+
+    for _ in range(3 * SimulationEngine.STATE_POOL_SIZE + 1):
+        state = pooled.tick()
+        # Read the cached totals so a stale cache would be seen on reuse
+        state.is_grid_stable
+        fresh._state_pool = [None] * SimulationEngine.STATE_POOL_SIZE
+        expected = fresh.tick()
+
+        assert state.model_dump_json() == expected.model_dump_json()
+        assert state.supply_demand_balance == expected.supply_demand_balance
+
+
+def test_pooled_state_is_overwritten_when_its_slot_comes_around():
+    sim = SimulationEngine(seed=SEED)
+    held = sim.tick()
+    kept = held.model_copy(deep=True)
+
+    for _ in range(SimulationEngine.STATE_POOL_SIZE):
+        latest = sim.tick()
+
+    assert latest is held
+    assert held.model_dump_json() != kept.model_dump_json()
+
+
+def test_simulate_timeseries_updates_the_current_state():
+    sim = SimulationEngine(seed=SEED)
+    sim.tick()
+    sim.get_current_state_json()
+
+    # An hour of calm, cloudy night drains the battery
+    n = 4
+    out = sim.simulate_timeseries(np.zeros(n), np.full(n, 12.0), np.zeros(n), np.ones(n))
+    charge = sim.battery.current_charge_mwh
+    assert out["battery_charge_mwh"][-1] == pytest.approx(charge)
+
+    state = json.loads(sim.get_current_state_json())
+    assert state["battery"]["current_charge_mwh"] == charge
+    assert sim.get_current_state().metrics.grid_uptime_percent == sim._calculate_uptime_percent()
+
+
+@pytest.mark.parametrize("n_ticks, sample_every", [(-1, 4), (10, 0), (10, -2)])
+def test_run_batch_rejects_bad_arguments(n_ticks, sample_every):
+    sim = SimulationEngine(seed=SEED)
+    with pytest.raises(ValueError, match="must be >= "):
+        sim.run_batch(n_ticks, sample_every=sample_every)
+    assert sim.time.total_ticks == 0
+
+
+def test_run_batch_without_ticks_is_a_no_op():
+    sim = SimulationEngine(seed=SEED)
+    assert sim.run_batch(0) == []
+    assert sim.time.total_ticks == 0
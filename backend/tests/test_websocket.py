@@ -0,0 +1,165 @@
+"""Tests for the shared simulation broadcast loop"""
+
+import asyncio
+from contextlib import suppress
+
+import pytest
+from fastapi import WebSocketDisconnect
+from fastapi.testclient import TestClient
+
+from app.api import websocket
+from app.main import app
+from app.simulation.simulation_engine import SimulationEngine
+
+
+@pytest.fixture
+def broadcasts(monkeypatch):
+    """Payloads simulation_loop broadcasts, with one fake client connected"""
+    sent = []
+
+    async def record(payload):
+        sent.append(payload)
+
+    monkeypatch.setattr(websocket, "TICK_PERIOD_SECONDS", 0.001)
+    monkeypatch.setattr(websocket.manager, "broadcast", record)
+    monkeypatch.setattr(websocket.manager, "active_connections", {object()})
+    return sent
+
+
+async def run_loop_until(sent, message_type):
+    """Run simulation_loop until it broadcasts a message_type message"""
+    task = asyncio.create_task(websocket.simulation_loop())
+    try:
+        for _ in range(200):
+            if task.done() or any(f'"{message_type}"' in payload for payload in sent):
+                break
+            await asyncio.sleep(0.005)
+        assert not task.done()
+    finally:
+        task.cancel()
+        with suppress(asyncio.CancelledError):
+            await task
+
+
+@pytest.mark.asyncio
+async def test_simulation_loop_survives_a_failed_tick(monkeypatch, broadcasts):
+    engine = SimulationEngine(seed=1)
+    calls = 0
+
+    def flaky_engine():
+        nonlocal calls
+        calls += 1
+        if calls == 1:
+            raise RuntimeError("boom")
+        return engine
+
+    monkeypatch.setattr(websocket, "get_engine", flaky_engine)
+    await run_loop_until(broadcasts, "state_update")
+
+    assert calls >= 2
+    assert any('"state_update"' in payload for payload in broadcasts)
+
+
+@pytest.mark.asyncio
+async def test_new_engine_static_info_is_broadcast_after_a_client_initial_send(
+        monkeypatch, broadcasts):
+    old_engine = SimulationEngine(seed=1)
+    new_engine = SimulationEngine(seed=2)
+    monkeypatch.setattr(websocket, "_broadcast_engine", old_engine)
+    monkeypatch.setattr(websocket, "get_engine", lambda: new_engine)
+
+    # A client connecting after the reset gets its own static_info first
+    websocket.serialize_static(new_engine, new_engine.get_current_state())
+    assert websocket.static_changed(new_engine)
+
+    await run_loop_until(broadcasts, "state_update")
+
+    assert '"static_info"' in broadcasts[0]
+    assert not websocket.static_changed(new_engine)
+
+
+class FakeWebSocket:
+    """Records frames in the order their sends complete"""
+
+    def __init__(self, first_send_delay=0.0):
+        self.frames = []
+        self._delays = [first_send_delay]
+        self.closed = asyncio.Event()
+
+    async def accept(self):
+        pass
+
+    async def send_text(self, payload):
+        if self._delays:
+            await asyncio.sleep(self._delays.pop())
+        self.frames.append(payload)
+
+    async def send_json(self, data):
+        self.frames.append(data)
+
+    async def receive_json(self):
+        await self.closed.wait()
+        raise WebSocketDisconnect()
+
+
+@pytest.mark.asyncio
+async def test_client_gets_static_info_before_any_broadcast(monkeypatch):
+    engine = SimulationEngine(seed=1)
+    monkeypatch.setattr(websocket, "TICK_PERIOD_SECONDS", 0.001)
+    monkeypatch.setattr(websocket, "get_engine", lambda: engine)
+    monkeypatch.setattr(websocket, "_broadcast_engine", engine)
+    monkeypatch.setattr(websocket.manager, "active_connections", {FakeWebSocket()})
+
+    # The loop keeps ticking while the new client's first frame is slow
+    client = FakeWebSocket(first_send_delay=0.05)
+    loop_task = asyncio.create_task(websocket.simulation_loop())
+    endpoint = asyncio.create_task(websocket.websocket_endpoint(client))
+    try:
+        for _ in range(200):
+            if len(client.frames) >= 3:
+                break
+            await asyncio.sleep(0.005)
+    finally:
+        client.closed.set()
+        await endpoint
+        loop_task.cancel()
+        with suppress(asyncio.CancelledError):
+            await loop_task
+
+    assert '"static_info"' in client.frames[0]
+    assert all('"state_update"' in frame for frame in client.frames[1:])
+    assert client not in websocket.manager.active_connections
+
+
+def test_bad_commands_get_an_error_and_the_stream_continues(monkeypatch):
+    monkeypatch.setattr(websocket, "speed_multiplier", 20.0)
+    bad_commands = [
+        {"action": "set_wind"},
+        {"action": "set_temperature", "value": "hot"},
+        {"action": "set_clouds", "value": True},
+        {"action": "toggle_industrial", "value": "yes"},
+    ]
+
+    with TestClient(app) as client, client.websocket_connect("/ws") as ws:
+        assert ws.receive_json()["type"] == "static_info"
+        assert ws.receive_json()["type"] == "state_update"
+        engine = websocket.get_engine()
+        industrial = engine.demand.industrial_enabled
+
+        ws.send_bytes(b"\x00binary")
+        for command in bad_commands:
+            ws.send_json(command)
+
+        errors, updates = [], []
+        while len(errors) < len(bad_commands) or not updates:
+            message = ws.receive_json()
+            (errors if message["type"] == "error" else updates).append(message)
+
+        assert [e["action"] for e in errors] == [c["action"] for c in bad_commands]
+        assert updates[-1]["type"] == "state_update"
+        assert engine.demand.industrial_enabled is industrial
+
+        ws.send_json({"action": "set_wind", "value": 12})
+        while (message := ws.receive_json())["type"] != "command_ack":
+            pass
+        assert engine.weather.wind_speed == 12
@@ -63,10 +63,55 @@ interface GridState {
   is_grid_stable: boolean;
 }
 
+// Short keys the backend uses on the wire for per-tick fields
+// (serialization aliases in backend/app/models/grid_state.py)
+const WIRE_KEYS: Record<string, string> = {
+  bl: 'base_load',
+  il: 'industrial_load',
+  hcl: 'heating_cooling_load',
+  td: 'total_demand',
+  out: 'current_output_mw',
+  cf: 'capacity_factor',
+  chg: 'current_charge_mwh',
+  chg_pct: 'charge_level_percent',
+  ren_pct: 'renewable_energy_percent',
+  co2_kg: 'co2_emissions_kg',
+  cost_eur: 'operational_cost_eur',
+  uptime_pct: 'grid_uptime_percent',
+  gas_acts: 'gas_activation_count',
+  batt_cyc: 'battery_cycles',
+  gen: 'total_generation_mw',
+  ren: 'total_renewable_mw',
+  bal: 'supply_demand_balance',
+  stable: 'is_grid_stable',
+};
+
+const expandKeys = (value: any): any => {
+  if (value === null || typeof value !== 'object') {
+    return value;
+  }
+  const expanded: Record<string, any> = {};
+  for (const [key, item] of Object.entries(value)) {
+    expanded[WIRE_KEYS[key] ?? key] = expandKeys(item);
+  }
+  return expanded;
+};
+
+// Capacities and source types arrive once in a static_info message;
+// each state_update only carries the per-tick values
+const mergeStatic = (staticData: Record<string, any>, data: Record<string, any>): GridState => {
+  const merged: Record<string, any> = { ...data };
+  for (const key of Object.keys(staticData)) {
+    merged[key] = { ...staticData[key], ...data[key] };
+  }
+  return merged as GridState;
+};
+
 export const useWebSocket = () => {
   const [gridState, setGridState] = useState<GridState | null>(null);
   const [isConnected, setIsConnected] = useState(false);
   const wsRef = useRef<WebSocket | null>(null);
+  const staticRef = useRef<Record<string, any>>({});
 
   useEffect(() => {
     // Connect to WebSocket
@@ -81,8 +126,10 @@ export const useWebSocket = () => {
     ws.onmessage = (event) => {
       const message = JSON.parse(event.data);
       
-      if (message.type === 'state_update') {
-        setGridState(message.data);
+      if (message.type === 'static_info') {
+        staticRef.current = expandKeys(message.data);
+      } else if (message.type === 'state_update') {
+        setGridState(mergeStatic(staticRef.current, expandKeys(message.data)));
       }
     };
 